@@ -3,6 +3,12 @@ import os
 from datetime import datetime
 
 class DatabaseManager:
+    # Tables rebuilt from drawings rather than holding data of their own: the
+    # FTS5 search index (and its shadow tables) and the per-job drawing counts.
+    # The JSON export/import skips them and rebuilds them after an import.
+    DERIVED_TABLE_PREFIXES = ('drawings_fts',)
+    DERIVED_TABLES = {'drawing_counts'}
+    
     def __init__(self, db_path="drafting_tools.db"):
         self.db_path = db_path
         self.backup_path = "backup"
@@ -423,6 +429,22 @@ class DatabaseManager:
             shutil.copy2(self.master_db_path, self.db_path)
             print(f"Database restored from {self.master_db_path}")
     
+    def _is_derived_table(self, table_name):
+        return table_name in self.DERIVED_TABLES or table_name.startswith(self.DERIVED_TABLE_PREFIXES)
+    
+    def _rebuild_derived_tables(self, cursor):
+        """Rebuild the drawing search index and counts from the drawings table"""
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('drawings_fts', 'drawing_counts')")
+        existing = {row[0] for row in cursor.fetchall()}
+        if 'drawings_fts' in existing:
+            cursor.execute("INSERT INTO drawings_fts(drawings_fts) VALUES ('rebuild')")
+        if 'drawing_counts' in existing:
+            cursor.execute("DELETE FROM drawing_counts")
+            cursor.execute('''
+                INSERT INTO drawing_counts(job_number, cnt)
+                SELECT job_number, COUNT(*) FROM drawings GROUP BY job_number
+            ''')
+    
     def export_to_json(self):
         """Export all data to JSON file"""
         import json
@@ -437,6 +459,8 @@ class DatabaseManager:
         data = {}
         for table in tables:
             table_name = table['name']
+            if self._is_derived_table(table_name):
+                continue
             cursor.execute(f"SELECT * FROM {table_name}")
             rows = cursor.fetchall()
             data[table_name] = [dict(row) for row in rows]
@@ -460,7 +484,8 @@ class DatabaseManager:
         cursor = conn.cursor()
         
         for table_name, rows in data.items():
-            if not rows:
+            # Older exports may include the search index and counts; they are rebuilt below
+            if not rows or self._is_derived_table(table_name):
                 continue
             
             # Clear existing data
@@ -473,6 +498,7 @@ class DatabaseManager:
                 values = list(row.values())
                 cursor.execute(f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})", values)
         
+        self._rebuild_derived_tables(cursor)
         conn.commit()
         conn.close()
         print(f"Data imported from {self.master_json_path}")
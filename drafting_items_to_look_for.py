@@ -339,6 +339,14 @@ class DraftingChecklistApp:
         refresh_btn = ttk.Button(action_frame, text="🔄 Refresh", command=self.load_master_items)
         refresh_btn.pack(side=tk.RIGHT)
         
+        # Context menu built once; the right-click handler records the item id
+        self._master_item_ctx_id = None
+        self.master_item_ctx = tk.Menu(self.root, tearoff=0)
+        self.master_item_ctx.add_command(label="View Image", command=self._ctx_view_master_item_image)
+        self.master_item_ctx.add_command(label="Edit", command=self.edit_master_item)
+        self.master_item_ctx.add_separator()
+        self.master_item_ctx.add_command(label="Delete", command=self.delete_master_item)
+        
         # Bind events for master items
         self.master_tree.bind('<Double-1>', self.on_master_item_double_click)
         self.master_tree.bind('<Button-3>', self.on_master_item_right_click)
@@ -362,7 +370,7 @@ class DraftingChecklistApp:
             return
         vals = self.project_tree.item(sel[0], 'values')
         job_number = vals[0]
-        open_add_note_dialog(self.root, str(job_number))
+        open_add_note_dialog(self.root, str(job_number), conn=self.conn)
         
     def load_projects(self):
         """Load all projects from the projects table"""
@@ -897,21 +905,16 @@ class DraftingChecklistApp:
         selection = self.master_tree.selection()
         if selection:
             item = self.master_tree.item(selection[0])
-            item_id = item['values'][0]
-            title = item['values'][2]  # Title is now in column 2
-            
-            # Create context menu
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="View Image", command=lambda: self.view_master_item_image_by_id(item_id))
-            context_menu.add_command(label="Edit", command=self.edit_master_item)
-            context_menu.add_separator()
-            context_menu.add_command(label="Delete", command=self.delete_master_item)
+            self._master_item_ctx_id = item['values'][0]
             
             # Show context menu
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                self.master_item_ctx.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                self.master_item_ctx.grab_release()
+    
+    def _ctx_view_master_item_image(self):
+        self.view_master_item_image_by_id(self._master_item_ctx_id)
     
     def view_master_item_image(self, title):
         """View image for a master item"""
@@ -1,6 +1,8 @@
 import sys
 import subprocess
-import psutil
+
+# psutil is imported lazily in _get_psutil() to keep launcher startup fast
+_psutil = None
 
 APP_MAP = {
     'dashboard': {'script': 'dashboard.py', 'title': 'Drafting Tools Dashboard'},
@@ -19,7 +21,17 @@ APP_MAP = {
 }
 
 
+def _get_psutil():
+    """Import psutil on first use and memoize the module."""
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+
 def _find_process_for_script(script_name: str):
+    psutil = _get_psutil()
     for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
         try:
             cmdline = proc.info.get('cmdline') or []
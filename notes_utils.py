@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
 from datetime import datetime
+from typing import Optional
 
 try:
     from db_utils import get_connection
@@ -23,10 +24,16 @@ def _ensure_table(cur):
         """
     )
 
-def append_job_note(job_number: str, note_text: str) -> bool:
-    """Append a note to the job's notes blob with timestamp and (optionally) current user."""
+def append_job_note(job_number: str, note_text: str, conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+    """Append a note to the job's notes blob with timestamp and (optionally) current user.
+
+    Returns the header-prefixed fragment that was prepended, or None on failure,
+    so callers showing the notes can insert it locally instead of reloading.
+    Pass ``conn`` to reuse the caller's connection; the write is wrapped in a
+    savepoint so the caller's own pending work is neither committed nor rolled back.
+    """
     if not note_text.strip():
-        return False
+        return None
     try:
         user = None
         dept = None
@@ -38,32 +45,44 @@ def append_job_note(job_number: str, note_text: str) -> bool:
         except Exception:
             pass
 
-        conn = _conn()
-        cur = conn.cursor()
-        _ensure_table(cur)
-        cur.execute("SELECT notes FROM job_notes WHERE job_number = ?", (str(job_number),))
-        row = cur.fetchone()
-        existing = row[0] if row and row[0] else ""
-
         ts = datetime.now().strftime('%Y-%m-%d %H:%M')
-        header = f"=== {ts}"
-        if user:
-            if dept:
-                header += f" by {user} ({dept})"
-            else:
-                header += f" by {user}"
-        header += " ===\n"
+        by = (f" by {user} ({dept})" if dept else f" by {user}") if user else ""
+        new_fragment = f"=== {ts}{by} ===\n{note_text.strip()}\n\n"
 
-        new_blob = f"{header}{note_text.strip()}\n\n" + (existing or "")
-        cur.execute("INSERT OR REPLACE INTO job_notes (job_number, notes) VALUES (?, ?)", (str(job_number), new_blob))
-        conn.commit()
-        conn.close()
-        return True
+        owns_conn = conn is None
+        if owns_conn:
+            conn = _conn()
+        cur = conn.cursor()
+        cur.execute("SAVEPOINT append_job_note")
+        try:
+            _ensure_table(cur)
+            # Prepend in a single UPSERT instead of SELECT + INSERT OR REPLACE
+            cur.execute(
+                """
+                INSERT INTO job_notes (job_number, notes) VALUES (?, ?)
+                ON CONFLICT(job_number) DO UPDATE SET notes = excluded.notes || COALESCE(job_notes.notes, '')
+                """,
+                (str(job_number), new_fragment),
+            )
+            cur.execute("RELEASE SAVEPOINT append_job_note")
+        except Exception:
+            cur.execute("ROLLBACK TO SAVEPOINT append_job_note")
+            cur.execute("RELEASE SAVEPOINT append_job_note")
+            raise
+        finally:
+            if owns_conn:
+                conn.commit()
+                conn.close()
+        return new_fragment
     except Exception:
-        return False
+        return None
+
+def open_add_note_dialog(parent, job_number: str, on_saved=None, conn=None):
+    """Open a modal to add a note for the given job number.
 
-def open_add_note_dialog(parent, job_number: str):
-    """Open a modal to add a note for the given job number."""
+    If given, ``on_saved(job_number, fragment)`` is called after a successful save,
+    and ``conn`` is reused for the write instead of opening a new connection.
+    """
     win = tk.Toplevel(parent)
     win.title(f"Add Note — Job {job_number}")
     win.transient(parent)
@@ -85,10 +104,12 @@ def open_add_note_dialog(parent, job_number: str):
         if not content:
             messagebox.showwarning("Empty", "Please enter a note body before saving.", parent=win)
             return
-        ok = append_job_note(job_number, content)
-        if ok:
+        fragment = append_job_note(job_number, content, conn=conn)
+        if fragment:
             messagebox.showinfo("Saved", "Note saved to job notes.", parent=win)
             win.destroy()
+            if on_saved:
+                on_saved(job_number, fragment)
         else:
             messagebox.showerror("Error", "Failed to save note.", parent=win)
 
@@ -5,11 +5,15 @@ Manages drawing print packages for projects with global search and print functio
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import sqlite3
 import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+import concurrent.futures
 from datetime import datetime
 from db_utils import get_connection
 from ui_prefs import bind_tree_column_persistence
@@ -18,17 +22,415 @@ from notes_utils import open_add_note_dialog
 from app_nav import add_app_bar
 from help_utils import add_help_button
 import json
+from typing import List, NamedTuple, Optional, Union
+
+# Optional: MessagePack sidecar for faster package export/import
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional: Windows printing and shell verbs; PRINT and manual steps are used without it
+try:
+    import pythoncom
+    import win32api
+    import win32print
+except ImportError:
+    pythoncom = win32api = win32print = None
+
+# Optional: faster JSON encode/decode for packages; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: C-level structural validation of imported packages
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _PackageDrawing(msgspec.Struct):
+        name: Optional[str] = ''
+        type: Optional[str] = ''
+        path: Optional[str] = ''
+        extension: Optional[str] = ''
+        added_date: Optional[str] = ''
+
+    class _Package(msgspec.Struct):
+        job_number: Union[str, int]
+        drawings: List[_PackageDrawing] = []
+
+# Drawing type shown for each file extension; anything else is 'Other'
+DRAWING_TYPES = {
+    '.dwg': 'AutoCAD',
+    '.idw': 'Inventor',
+    '.pdf': 'PDF',
+}
+
+DRAWING_FILETYPES = (
+    ("Drawing files", "*.dwg *.idw *.pdf"),
+    ("AutoCAD files", "*.dwg"),
+    ("Inventor files", "*.idw"),
+    ("PDF files", "*.pdf"),
+    ("All files", "*.*"),
+)
+
+# Sheet width x height in inches for each paper size (all landscape)
+PAPER_SIZES = {
+    'A': (11, 8.5),    # 8.5T x 11W
+    'B': (17, 11),     # 11T x 17W
+    'C': (24, 18),     # 18T x 24W
+    'D': (36, 24),     # 24T x 36W
+}
+DEFAULT_PAPER_SIZE = PAPER_SIZES['A']
+
+# Filename markers for each paper size, checked in order (case insensitive)
+PAPER_SIZE_PATTERNS = (
+    ('A', ('A-SIZE', 'A_SIZE', '_A.', 'SIZE-A', 'SIZE_A', '8.5X11', 'A4', 'LETTER')),
+    ('B', ('B-SIZE', 'B_SIZE', '_B.', 'SIZE-B', 'SIZE_B', '11X17', 'B4', 'TABLOID')),
+    ('C', ('C-SIZE', 'C_SIZE', '_C.', 'SIZE-C', 'SIZE_C', '18X24', 'C4')),
+    ('D', ('D-SIZE', 'D_SIZE', '_D.', 'SIZE-D', 'SIZE_D', '24X36', 'D4')),
+)
+
+
+class _ProjectRow(NamedTuple):
+    """One cached project for the project list filter"""
+    job_number: Union[str, int]
+    customer: str
+    drawing_count: int
+    is_completed: int
+    # Lowercased "job\ncustomer", matched against the search term
+    search_key: str
+
+
+def _tune_connection(conn):
+    """Extra PRAGMAs for this app's connections (get_connection already sets WAL + synchronous=NORMAL)"""
+    try:
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB memory-mapped reads
+        conn.execute("PRAGMA cache_spill = OFF")  # keep dirty pages in memory during bulk inserts
+    except Exception:
+        pass
+
+
+def _validate_package(package_data):
+    """Check an imported package's shape up front; returns an error message or None"""
+    if msgspec is not None:
+        try:
+            msgspec.convert(package_data, type=_Package)
+        except msgspec.ValidationError as e:
+            return str(e)
+        return None
+    
+    if not isinstance(package_data, dict) or 'job_number' not in package_data:
+        return "Missing job_number"
+    drawings = package_data.get('drawings', [])
+    if not isinstance(drawings, list):
+        return "'drawings' must be a list"
+    for i, drawing in enumerate(drawings):
+        if not isinstance(drawing, dict):
+            return f"Drawing {i} is not an object"
+        for key in ('name', 'type', 'path', 'extension'):
+            if not isinstance(drawing.get(key, ''), (str, type(None))):
+                return f"Drawing {i}: '{key}' must be text"
+    return None
+
+
+def _package_drawing_rows(package_data):
+    """Normalize a package's drawing dicts once into (name, type, path, extension) tuples"""
+    return [
+        (d.get('name', ''), d.get('type', ''), d.get('path', ''), d.get('extension', ''))
+        for d in package_data.get('drawings', [])
+    ]
+
+
+def _existing_paths(paths):
+    """Return the subset of paths that exist, reading each parent directory once
+    
+    One scandir per folder replaces a stat per file, which matters on network shares.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    
+    existing = set()
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            continue  # Missing or unreadable folder: none of its files exist
+        existing.update(p for p in dir_paths if os.path.normcase(os.path.basename(p)) in names)
+    return existing
+
+
+def _require_win32():
+    """Raise ImportError if pywin32 isn't installed, for callers with a fallback"""
+    if win32api is None:
+        raise ImportError("pywin32 is not installed")
+
+
+PRINTER_LIST_TTL = 30  # seconds
+_printer_list_cache = [0.0, None]
+
+
+def _enum_printers(refresh=False):
+    """Return the names of the local and connected printers
+    
+    Enumerating connections asks every print server for its printers, which can
+    take seconds with many mapped printers, so the list is reused for
+    PRINTER_LIST_TTL seconds unless refresh is set. Raises ImportError without
+    pywin32.
+    """
+    stamp, printers = _printer_list_cache
+    if refresh or printers is None or time.monotonic() - stamp > PRINTER_LIST_TTL:
+        _require_win32()
+        flags = win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
+        printers = [printer[2] for printer in win32print.EnumPrinters(flags)]  # printer[2] is the printer name
+        _printer_list_cache[:] = [time.monotonic(), printers]
+    return list(printers)
+
+
+def _copy_file(src, dst):
+    """Copy src to dst, keeping its timestamps
+    
+    On Windows this goes through CopyFileW, which lets SMB servers copy a file
+    between shares on the server instead of pulling it through this machine.
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(src, dst, False):
+                return
+        except Exception:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _print_raw(file_path, printer_name, copies=1):
+    """Spool file_path to printer_name as RAW data, like PRINT /D: does
+    
+    Talks to the spooler directly instead of starting cmd.exe per file, and takes
+    the printer name as data rather than a command line. Returns None when
+    pywin32 isn't installed so callers can fall back to PRINT; spooler errors
+    are raised.
+    """
+    if win32print is None:
+        return None
+    
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    handle = win32print.OpenPrinter(printer_name)
+    try:
+        for _ in range(copies):
+            win32print.StartDocPrinter(handle, 1, (os.path.basename(file_path), None, "RAW"))
+            try:
+                win32print.StartPagePrinter(handle)
+                win32print.WritePrinter(handle, data)
+                win32print.EndPagePrinter(handle)
+            finally:
+                win32print.EndDocPrinter(handle)
+    finally:
+        win32print.ClosePrinter(handle)
+    return True
+
+
+def _page_layout(width, height):
+    """Page size and fixed coordinates, in points, of an info page on width x height inches"""
+    corners = ((0.5, 0.5), (width - 1, 0.5), (0.5, height - 1), (width - 1, height - 1))
+    return {
+        'pagesize': (width * 72, height * 72),
+        'title': (72, (height - 1.5) * 72),
+        'lines': (72, (height - 2.5) * 72),
+        # Border plus corner marks
+        'rects': ((36, 36, (width - 1) * 72, (height - 1) * 72),)
+                 + tuple((x * 72, y * 72, 36, 36) for x, y in corners),
+    }
+
+
+# Computed once per paper size rather than for every page drawn
+PAGE_LAYOUTS = {size: _page_layout(width, height) for size, (width, height) in PAPER_SIZES.items()}
+
+
+def _pdf_literal(text):
+    """Encode text as a PDF string literal for the standard fonts' WinAnsi encoding"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return b'(' + escaped.encode('cp1252', 'replace') + b')'
+
+
+def _info_page_pdf(layout, title, lines):
+    """Return the bytes of a one-page PDF with a title, info lines, border and corner marks
+    
+    layout is an entry of PAGE_LAYOUTS. The page only uses Helvetica, which PDF
+    readers provide themselves, so the file is written directly; ReportLab's
+    import and per-canvas setup cost far more than the page does.
+    """
+    ops = [b"BT", b"/F2 24 Tf", b"1 0 0 1 %g %g Tm" % layout['title'], _pdf_literal(title) + b" Tj",
+           b"/F1 16 Tf", b"36 TL", b"1 0 0 1 %g %g Tm" % layout['lines']]
+    ops += [_pdf_literal(line) + b" Tj T*" for line in lines]
+    ops.append(b"ET")
+    ops += [b"%g %g %g %g re" % rect for rect in layout['rects']]
+    ops.append(b"S")
+    stream = b"\n".join(ops)
+    
+    objects = (
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %g %g] /Contents 6 0 R"
+        b" /Resources << /Font << /F1 4 0 R /F2 5 0 R >> >> >>" % layout['pagesize'],
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    )
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(pdf)
+
+
+def _init_print_worker():
+    """Initialize COM on print pool threads so ShellExecute print verbs work there"""
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+
 
 class PrintPackageApp:
+    # Marks shown in the current drawings' Printed column
+    PRINTED_ON = '✅'
+    PRINTED_OFF = '☐'
+    
+    # Statements reused on every load/search; kept as constants so sqlite3's
+    # per-connection statement cache can reuse the prepared statements
+    # Counts come from the trigger-maintained drawing_counts table, so this
+    # no longer aggregates over every drawing on each refresh. If that table
+    # couldn't be created, _SQL_LOAD_PROJECTS_COUNTING counts the drawings instead.
+    _SQL_LOAD_PROJECTS_TEMPLATE = """
+        SELECT p.job_number, p.customer_name, 
+               {drawing_count} as drawing_count,
+               MAX(CASE 
+                   WHEN (COALESCE(p.released_to_dee, rd.release_date) IS NOT NULL AND COALESCE(p.released_to_dee, rd.release_date) != '')
+                        OR rd.is_completed = 1
+                        OR (p.completion_date IS NOT NULL AND p.completion_date != '')
+                   THEN 1 ELSE 0 END) AS is_completed
+        FROM projects p
+        {counts_join}
+        LEFT JOIN release_to_dee rd ON rd.project_id = p.id
+        GROUP BY p.job_number, p.customer_name
+        ORDER BY p.job_number
+    """
+    _SQL_LOAD_PROJECTS_WITH_COUNTS = _SQL_LOAD_PROJECTS_TEMPLATE.format(
+        drawing_count="COALESCE(c.cnt, 0)",
+        counts_join="LEFT JOIN drawing_counts c ON c.job_number = p.job_number")
+    _SQL_LOAD_PROJECTS_COUNTING = _SQL_LOAD_PROJECTS_TEMPLATE.format(
+        drawing_count="(SELECT COUNT(*) FROM drawings d WHERE d.job_number = p.job_number)",
+        counts_join="")
+    _SQL_LOAD_PROJECTS = """
+        SELECT job_number, customer_name
+        FROM projects 
+        ORDER BY job_number
+    """
+    _SQL_JOB_DIRECTORY = "SELECT job_directory FROM projects WHERE job_number = ?"
+    # Returns ready-to-insert tree rows; bind (PRINTED_ON, PRINTED_OFF, job_number)
+    _SQL_LOAD_CURRENT = """
+        SELECT CASE WHEN COALESCE(printed, 0) THEN ? ELSE ? END,
+               drawing_name,
+               COALESCE(NULLIF(drawing_type, ''), NULLIF(file_extension, ''), 'Unknown'),
+               drawing_path,
+               'Open | Print | Delete'
+        FROM drawings 
+        WHERE job_number = ?
+        ORDER BY drawing_name
+    """
+    _SQL_GLOBAL_SEARCH_FTS = """
+        SELECT job_number, drawing_name, drawing_type, drawing_path, file_extension
+        FROM drawings 
+        WHERE id IN (SELECT rowid FROM drawings_fts WHERE drawings_fts MATCH ?)
+        ORDER BY job_number, drawing_name
+        LIMIT ?
+    """
+    # Shared by every add path; a drawing that's already in the job is a no-op.
+    # The NOT EXISTS probe is an index lookup, and it still holds on databases
+    # where ux_drawings_job_path couldn't be created. added_date is stamped by
+    # SQLite in the same local "YYYY-MM-DD HH:MM:SS" form as before.
+    _SQL_INSERT_DRAWING = """
+        INSERT OR IGNORE INTO drawings (job_number, drawing_path, drawing_name, drawing_type, 
+                                     file_extension, added_date, added_by)
+        SELECT ?1, ?2, ?3, ?4, ?5, datetime('now', 'localtime'), ?6
+        WHERE NOT EXISTS (SELECT 1 FROM drawings WHERE job_number = ?1 AND drawing_path = ?2)
+    """
+    _SQL_GLOBAL_SEARCH_LIKE = """
+        SELECT job_number, drawing_name, drawing_type, drawing_path, file_extension
+        FROM drawings 
+        WHERE drawing_name LIKE ? ESCAPE '\\' OR drawing_path LIKE ? ESCAPE '\\'
+        ORDER BY job_number, drawing_name
+        LIMIT ?
+    """
+    
+    # Large global search results are rendered a page at a time as the user scrolls
+    _GLOBAL_RENDER_THRESHOLD = 500
+    _GLOBAL_RENDER_CHUNK = 200
+    # Searches stop after this many matches and end with a "refine search" row
+    _GLOBAL_RESULT_LIMIT = 500
+    
     def __init__(self, job_number=None):
         self.root = tk.Tk()
         self.root.title("Print Package Management - Drafting Tools")
         self.root.state('zoomed')  # Maximized window
         
+        # Screen size, read once for centering dialogs
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+        
         # Store job number for preloading
         self.preload_job_number = job_number
         self.root.minsize(1200, 800)
         
+        # Project rows from the last load_projects query; filtering runs on this
+        self._projects_cache = []
+        self._project_cache_index = {}
+        self._project_item_by_job = {}
+        self._project_row_values = {}
+        self._visible_project_items = []
+        self._project_filter_after_id = None
+        self._search_after_id = None
+        self._last_project_filter_term = None
+        self._last_global_search_term = None
+        
+        # Background pool for spooler submissions (Print All)
+        self._print_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="print", initializer=_init_print_worker)
+        
+        # Single DB worker for the list queries so a slow query doesn't freeze the UI.
+        # It opens its own connection on first use (sqlite3 connections are thread-bound).
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db", initializer=self._init_db_worker)
+        self._search_generation = 0
+        self._global_rows = []
+        self._global_rendered = 0
+        self._ctx_drawing_path = None
+        self._global_row_meta = {}
+        self._current_path_by_iid = {}
+        self._current_printed_iids = set()
+        self._refresh_pending = False
+        self._refresh_jobs = set()
+        self._job_dir_cache = {}
+        self._pdf_folders_ready = set()
+        
+        # Paper size per drawing path and configured printer per paper size
+        self._paper_size_cache = {}
+        self._printer_for_size = {}
+
+        
         # Initialize database
         self.init_database()
         
@@ -95,7 +497,7 @@ class PrintPackageApp:
         
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
         self.project_search_var = tk.StringVar()
-        self.project_search_var.trace('w', self.filter_projects)
+        self.project_search_var.trace('w', self._schedule_project_filter)
         search_entry = ttk.Entry(search_frame, textvariable=self.project_search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -162,7 +564,7 @@ class PrintPackageApp:
         
         ttk.Label(search_frame, text="Global Search:").pack(side=tk.LEFT)
         self.global_search_var = tk.StringVar()
-        self.global_search_var.trace('w', self.search_global_drawings)
+        self.global_search_var.trace('w', self._schedule_global_search)
         global_search_entry = ttk.Entry(search_frame, textvariable=self.global_search_var, width=30)
         global_search_entry.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -209,6 +611,13 @@ class PrintPackageApp:
         # Scrollbar for current drawings
         current_scrollbar = ttk.Scrollbar(current_drawings_frame, orient=tk.VERTICAL, command=self.current_drawings_tree.yview)
         self.current_drawings_tree.configure(yscrollcommand=current_scrollbar.set)
+        
+        # Context menu built once; the right-click handler records which drawing it is for
+        self._current_context_menu = tk.Menu(self.root, tearoff=0)
+        self._current_context_menu.add_command(label="Open", command=self._ctx_open)
+        self._current_context_menu.add_command(label="Print", command=self._ctx_print)
+        self._current_context_menu.add_separator()
+        self._current_context_menu.add_command(label="Delete", command=self._ctx_delete)
 
         # Pack current drawings treeview
         self.current_drawings_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -244,7 +653,20 @@ class PrintPackageApp:
         
         # Scrollbar for global drawings
         global_scrollbar = ttk.Scrollbar(global_drawings_frame, orient=tk.VERTICAL, command=self.global_drawings_tree.yview)
-        self.global_drawings_tree.configure(yscrollcommand=global_scrollbar.set)
+        
+        def on_global_yscroll(first, last):
+            global_scrollbar.set(first, last)
+            # Scrolled near the end of what's rendered: attach the next page of a large result set
+            if float(last) > 0.9:
+                self._render_more_global_results()
+        
+        self.global_drawings_tree.configure(yscrollcommand=on_global_yscroll)
+        
+        self._global_context_menu = tk.Menu(self.root, tearoff=0)
+        self._global_context_menu.add_command(label="Open", command=self._ctx_open)
+        self._global_context_menu.add_command(label="Print", command=self._ctx_print)
+        self._global_context_menu.add_separator()
+        self._global_context_menu.add_command(label="Add to Current Job", command=self._ctx_add_to_current)
 
         # Pack global drawings treeview
         self.global_drawings_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -282,6 +704,7 @@ class PrintPackageApp:
     def init_database(self):
         """Initialize the database connection"""
         self.conn = get_connection('drafting_tools.db')
+        _tune_connection(self.conn)
         
         # Create printer configuration table if it doesn't exist
         cursor = self.conn.cursor()
@@ -305,6 +728,10 @@ class PrintPackageApp:
         else:
             print("ERROR: Failed to create printer configuration table")
         
+        # The schema doesn't change while the app runs, so check for drawings once
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='drawings'")
+        self._drawings_table_exists = cursor.fetchone() is not None
+        
         # Ensure drawings table has a 'printed' column for checkbox state
         try:
             cursor.execute("PRAGMA table_info(drawings)")
@@ -315,143 +742,308 @@ class PrintPackageApp:
         except Exception:
             pass
         
-    def load_projects(self):
-        """Load all projects from the projects table"""
+        self.drawings_fts_enabled = False
+        self.drawing_counts_enabled = False
+        if self._drawings_table_exists:
+            self.ensure_drawing_indexes(cursor)
+            self.ensure_drawing_counts(cursor)
+        
+    def ensure_drawing_indexes(self, cursor):
+        """Create the indexes used by the drawing lookups and global search"""
+        # A covering index that answers load_current_drawings (filter + ORDER BY
+        # drawing_name) without touching the table. The plain job_number index is
+        # created by database_setup.py with the other tables' indexes.
+        idx_statements = [
+            """CREATE INDEX IF NOT EXISTS idx_drawings_job_cov ON drawings(
+                   job_number, drawing_name, drawing_type, drawing_path, file_extension, printed)""",
+        ]
+        for stmt in idx_statements:
+            try:
+                cursor.execute(stmt)
+            except Exception:
+                pass
+        
+        # One row per (job, path). Older databases may list the same drawing twice
+        # in a job; those rows are left alone and the index is skipped until they
+        # are cleaned up (adds still check for the path, see _SQL_INSERT_DRAWING).
         try:
-            cursor = self.conn.cursor()
-            
-            # Check if drawings table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='drawings'
-            """)
-            drawings_table_exists = cursor.fetchone() is not None
-            
-            if drawings_table_exists:
-                # Get all projects with drawing counts and completion state
-                cursor.execute("""
-                    SELECT p.job_number, p.customer_name, 
-                           COALESCE(COUNT(d.id), 0) as drawing_count,
-                           CASE 
-                               WHEN (COALESCE(p.released_to_dee, rd.release_date) IS NOT NULL AND COALESCE(p.released_to_dee, rd.release_date) != '')
-                                    OR rd.is_completed = 1
-                                    OR (p.completion_date IS NOT NULL AND p.completion_date != '')
-                               THEN 1 ELSE 0 END AS is_completed
-                    FROM projects p
-                    LEFT JOIN drawings d ON p.job_number = d.job_number
-                    LEFT JOIN release_to_dee rd ON rd.project_id = p.id
-                    GROUP BY p.job_number, p.customer_name
-                    ORDER BY p.job_number
-                """)
-            else:
-                # Just get projects without drawing counts
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name='ux_drawings_job_path'")
+            if cursor.fetchone() is None:
                 cursor.execute("""
-                    SELECT job_number, customer_name
-                    FROM projects 
-                    ORDER BY job_number
+                    SELECT COUNT(*) FROM (
+                        SELECT 1 FROM drawings GROUP BY job_number, drawing_path HAVING COUNT(*) > 1)
                 """)
-            
-            projects = cursor.fetchall()
-            
-            # Clear existing items
-            for item in self.project_tree.get_children():
-                self.project_tree.delete(item)
-            
-            # Add projects to tree
-            for project in projects:
-                if drawings_table_exists:
-                    job_number, customer_name, drawing_count, is_completed = project
-                    customer = customer_name or "Unknown"
-                    # Hide completed projects unless toggle is on
-                    if self.show_completed or int(is_completed) == 0:
-                        self.project_tree.insert('', 'end', values=(
-                            job_number,
-                            customer,
-                            drawing_count
-                        ))
+                duplicates = cursor.fetchone()[0]
+                if duplicates:
+                    print(f"Not creating unique drawing index: {duplicates} drawing(s) are listed more than once in a job")
                 else:
-                    job_number, customer_name = project
-                    customer = customer_name or "Unknown"
-                    # Without drawings table, always show
-                    self.project_tree.insert('', 'end', values=(job_number, customer, 0))
-            
+                    cursor.execute("CREATE UNIQUE INDEX ux_drawings_job_path ON drawings(job_number, drawing_path)")
+        except Exception as e:
+            print(f"Error creating unique drawing index: {e}")
+        
+        # Trigram FTS5 index so substring search is an index lookup instead of
+        # a LIKE '%x%' scan. The trigram tokenizer needs SQLite 3.34+; older
+        # versions (such as the one bundled with Python 3.8) keep the LIKE search
+        # and get no triggers on drawings.
+        try:
+            if sqlite3.sqlite_version_info < (3, 34):
+                raise sqlite3.NotSupportedError(f"SQLite {sqlite3.sqlite_version} has no trigram tokenizer")
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='drawings_fts'")
+            fts_exists = cursor.fetchone() is not None
+            cursor.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS drawings_fts USING fts5(
+                    drawing_name, drawing_path,
+                    content='drawings', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS drawings_fts_ai AFTER INSERT ON drawings BEGIN
+                    INSERT INTO drawings_fts(rowid, drawing_name, drawing_path)
+                    VALUES (new.id, new.drawing_name, new.drawing_path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS drawings_fts_ad AFTER DELETE ON drawings BEGIN
+                    INSERT INTO drawings_fts(drawings_fts, rowid, drawing_name, drawing_path)
+                    VALUES ('delete', old.id, old.drawing_name, old.drawing_path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS drawings_fts_au AFTER UPDATE OF drawing_name, drawing_path ON drawings BEGIN
+                    INSERT INTO drawings_fts(drawings_fts, rowid, drawing_name, drawing_path)
+                    VALUES ('delete', old.id, old.drawing_name, old.drawing_path);
+                    INSERT INTO drawings_fts(rowid, drawing_name, drawing_path)
+                    VALUES (new.id, new.drawing_name, new.drawing_path);
+                END;
+            ''')
+            if not fts_exists:
+                # Populate once from the existing rows
+                cursor.execute("INSERT INTO drawings_fts(drawings_fts) VALUES ('rebuild')")
+            self.drawings_fts_enabled = True
         except Exception as e:
-            print(f"Error loading projects: {e}")
+            print(f"Drawing search index not available, using LIKE search: {e}")
+        self.conn.commit()
+        
+    def ensure_drawing_counts(self, cursor):
+        """Keep per-job drawing counts in a table maintained by triggers on drawings"""
+        try:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='drawing_counts'")
+            counts_exist = cursor.fetchone() is not None
+            cursor.executescript('''
+                CREATE TABLE IF NOT EXISTS drawing_counts (
+                    job_number TEXT PRIMARY KEY,
+                    cnt INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TRIGGER IF NOT EXISTS drawing_counts_ai AFTER INSERT ON drawings BEGIN
+                    INSERT INTO drawing_counts(job_number, cnt) VALUES (new.job_number, 1)
+                    ON CONFLICT(job_number) DO UPDATE SET cnt = cnt + 1;
+                END;
+                CREATE TRIGGER IF NOT EXISTS drawing_counts_ad AFTER DELETE ON drawings BEGIN
+                    UPDATE drawing_counts SET cnt = cnt - 1 WHERE job_number = old.job_number;
+                END;
+                CREATE TRIGGER IF NOT EXISTS drawing_counts_au AFTER UPDATE OF job_number ON drawings BEGIN
+                    UPDATE drawing_counts SET cnt = cnt - 1 WHERE job_number = old.job_number;
+                    INSERT INTO drawing_counts(job_number, cnt) VALUES (new.job_number, 1)
+                    ON CONFLICT(job_number) DO UPDATE SET cnt = cnt + 1;
+                END;
+            ''')
+            if not counts_exist:
+                # Seed from the existing rows
+                cursor.execute('''
+                    INSERT INTO drawing_counts(job_number, cnt)
+                    SELECT job_number, COUNT(*) FROM drawings GROUP BY job_number
+                ''')
+            self.conn.commit()
+            self.drawing_counts_enabled = True
+        except Exception as e:
+            print(f"Error creating drawing counts table, counting drawings instead: {e}")
+    
+    def _init_db_worker(self):
+        """Open the read connection used by the DB worker thread"""
+        self._read_conn = get_connection('drafting_tools.db')
+        _tune_connection(self._read_conn)
+        # Reads only; writes stay on self.conn so they never race with this thread
+        try:
+            self._read_conn.execute("PRAGMA query_only = ON")
+        except Exception:
+            pass
+    
+    def run_db_async(self, query, on_done, what="running query"):
+        """Run query(conn) on the DB worker and pass its result to on_done on the Tk thread"""
+        future = self._db_executor.submit(lambda: query(self._read_conn))
+        self.root.after(0, self._poll_future, future, on_done, what)
+    
+    def _poll_future(self, future, on_done, what):
+        """Pass a future's result to on_done on the Tk thread once it is done
+        
+        Serves both the DB worker and the print pool. A failure is printed with
+        what was being done, and on_done is not called.
+        """
+        if not future.done():
+            self.root.after(20, self._poll_future, future, on_done, what)
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Error {what}: {e}")
+            return
+        on_done(result)
+    
+    def load_projects(self):
+        """Load all projects from the projects table"""
+        self.run_db_async(self._query_projects, self._on_projects_loaded, "loading projects")
+    
+    def _query_projects(self, conn):
+        """Fetch project rows for the filter cache; runs on the DB worker
+        
+        Rows are _ProjectRow tuples; search_key is computed once here so filtering
+        does a single substring test per row and no lower() per keystroke.
+        """
+        if self._drawings_table_exists:
+            # Get all projects with drawing counts and completion state
+            sql = (self._SQL_LOAD_PROJECTS_WITH_COUNTS if self.drawing_counts_enabled
+                   else self._SQL_LOAD_PROJECTS_COUNTING)
+            projects = conn.execute(sql).fetchall()
+        else:
+            # Without drawings table, always show
+            projects = [(job_number, customer_name, 0, 0)
+                        for job_number, customer_name in conn.execute(self._SQL_LOAD_PROJECTS)]
+        
+        rows = []
+        for job_number, customer_name, drawing_count, is_completed in projects:
+            customer = customer_name or "Unknown"
+            rows.append(_ProjectRow(job_number, customer, drawing_count, int(is_completed),
+                                    f"{job_number}\n{customer}".lower()))
+        return rows
+    
+    def _on_projects_loaded(self, projects):
+        self._projects_cache = projects
+        self._job_dir_cache.clear()
+        self._pdf_folders_ready.clear()
+        
+        # Cache positions per job, so count refreshes don't scan every project
+        self._project_cache_index = {}
+        for i, project in enumerate(projects):
+            self._project_cache_index.setdefault(str(project.job_number), []).append(i)
+        
+        # Drop the rows of jobs that no longer exist; the rest are reused
+        live_jobs = {str(project[0]) for project in projects}
+        stale = [job_key for job_key in self._project_item_by_job if job_key not in live_jobs]
+        if stale:
+            removed = set()
+            for job_key in stale:
+                removed.add(self._project_item_by_job.pop(job_key))
+                self._project_row_values.pop(job_key, None)
+            self.project_tree.delete(*removed)
+            self._visible_project_items = [
+                item_id for item_id in self._visible_project_items if item_id not in removed
+            ]
+        self.filter_projects()
+        
+        # Select the job passed on the command line once its row exists; the
+        # <<TreeviewSelect>> binding then loads its drawings
+        if self.preload_job_number:
+            item_id = self._project_item_by_job.get(str(self.preload_job_number))
+            self.preload_job_number = None
+            if item_id in self._visible_project_items:
+                self.project_tree.selection_set(item_id)
+                self.project_tree.see(item_id)
+    
+    def _schedule_project_filter(self, *args):
+        """Debounce search keystrokes so only the last one in a burst filters"""
+        if self._project_filter_after_id:
+            self.root.after_cancel(self._project_filter_after_id)
+        self._project_filter_after_id = self.root.after(150, self._run_project_filter)
+    
+    def _run_project_filter(self):
+        self._project_filter_after_id = None
+        # Typing and then undoing within the debounce window leaves nothing to do
+        if self.project_search_var.get().lower() == self._last_project_filter_term:
+            return
+        self.filter_projects()
     
     def filter_projects(self, *args):
-        """Filter projects based on search term"""
+        """Filter the cached project list based on search term"""
         search_term = self.project_search_var.get().lower()
-        
-        # Clear existing items
-        for item in self.project_tree.get_children():
-            self.project_tree.delete(item)
-        
-        # Reload all projects and filter
+        self._last_project_filter_term = search_term
+        show_completed = self.show_completed
+        
+        # Build the visible rows first, then sync them to the tree in one pass
+        rows = [
+            (job_number, customer, drawing_count)
+            for job_number, customer, drawing_count, is_completed, search_key in self._projects_cache
+            # Hide completed projects unless toggle is on
+            if (show_completed or is_completed == 0)
+            and search_term in search_key
+        ]
+        
+        # Reuse the rows already built for each job: only new jobs are inserted and
+        # only changed rows are updated, filtered-out rows are just detached
+        tree = self.project_tree
+        items = self._project_item_by_job
+        row_values = self._project_row_values
+        visible = []
+        for values in rows:
+            job_key = str(values[0])
+            item_id = items.get(job_key)
+            if item_id is None:
+                item_id = items[job_key] = tree.insert('', 'end', values=values)
+            elif row_values.get(job_key) != values:
+                tree.item(item_id, values=values)
+            row_values[job_key] = values
+            visible.append(item_id)
+        
+        if visible != self._visible_project_items:
+            tree.set_children('', *visible)
+            self._visible_project_items = visible
+    
+    def request_refresh(self, job_number=None):
+        """Queue a refresh of the current drawings and job_number's count
+        
+        Requests made before Tk goes idle collapse into a single _do_refresh.
+        """
+        if job_number is not None:
+            self._refresh_jobs.add(str(job_number))
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_pending = False
+        jobs, self._refresh_jobs = self._refresh_jobs, set()
+        self.load_current_drawings()
+        self.refresh_project_counts(jobs)
+    
+    def refresh_project_counts(self, job_numbers):
+        """Update the given projects' drawing counts in place instead of reloading every project"""
+        job_keys = [str(job_number) for job_number in job_numbers]
+        if not job_keys:
+            return
         try:
-            cursor = self.conn.cursor()
-            
-            # Check if drawings table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='drawings'
-            """)
-            drawings_table_exists = cursor.fetchone() is not None
-            
-            if drawings_table_exists:
-                cursor.execute("""
-                    SELECT p.job_number, p.customer_name, 
-                           COALESCE(COUNT(d.id), 0) as drawing_count,
-                           CASE 
-                               WHEN (COALESCE(p.released_to_dee, rd.release_date) IS NOT NULL AND COALESCE(p.released_to_dee, rd.release_date) != '')
-                                    OR rd.is_completed = 1
-                                    OR (p.completion_date IS NOT NULL AND p.completion_date != '')
-                               THEN 1 ELSE 0 END AS is_completed
-                    FROM projects p
-                    LEFT JOIN drawings d ON p.job_number = d.job_number
-                    LEFT JOIN release_to_dee rd ON rd.project_id = p.id
-                    GROUP BY p.job_number, p.customer_name
-                    ORDER BY p.job_number
-                """)
+            placeholders = ",".join("?" * len(job_keys))
+            counts = dict.fromkeys(job_keys, 0)
+            if self.drawing_counts_enabled:
+                sql = f"SELECT job_number, cnt FROM drawing_counts WHERE job_number IN ({placeholders})"
             else:
-                cursor.execute("""
-                    SELECT job_number, customer_name
-                    FROM projects 
-                    ORDER BY job_number
-                """)
-            
-            projects = cursor.fetchall()
-            
-            for project in projects:
-                if drawings_table_exists:
-                    job_number, customer_name, drawing_count, is_completed = project
-                    customer = customer_name or "Unknown"
-                    
-                    # Filter based on search term
-                    if (search_term in str(job_number).lower() or 
-                        search_term in customer.lower()):
-                        if self.show_completed or int(is_completed) == 0:
-                            self.project_tree.insert('', 'end', values=(
-                                job_number,
-                                customer,
-                                drawing_count
-                            ))
-                else:
-                    job_number, customer_name = project
-                    customer = customer_name or "Unknown"
-                    
-                    # Filter based on search term
-                    if (search_term in str(job_number).lower() or 
-                        search_term in customer.lower()):
-                        self.project_tree.insert('', 'end', values=(job_number, customer, 0))
-            
+                sql = (f"SELECT job_number, COUNT(*) FROM drawings WHERE job_number IN ({placeholders}) "
+                       "GROUP BY job_number")
+            counts.update(self.conn.execute(sql, job_keys).fetchall())
+            
+            cache = self._projects_cache
+            for job_key, count in counts.items():
+                for i in self._project_cache_index.get(job_key, ()):
+                    cache[i] = cache[i]._replace(drawing_count=count)
+            
+            for job_key, count in counts.items():
+                item_id = self._project_item_by_job.get(job_key)
+                if item_id:
+                    self.project_tree.set(item_id, 'Drawings Count', count)
+                    values = self._project_row_values.get(job_key)
+                    if values:
+                        self._project_row_values[job_key] = values[:2] + (count,)
         except Exception as e:
-            print(f"Error filtering projects: {e}")
+            print(f"Error refreshing drawing count: {e}")
 
     def toggle_completed(self):
         """Toggle showing/hiding projects with drawings (completed)"""
         self.show_completed = not self.show_completed
         self.toggle_completed_btn.config(text=('Hide Completed' if self.show_completed else 'Show Completed'))
-        self.load_projects()
+        # The cache holds completed projects too, so this is a re-filter, not a re-query
+        self.filter_projects()
     
     def on_project_select(self, event):
         """Handle project selection"""
@@ -484,103 +1076,139 @@ class PrintPackageApp:
             return
         vals = self.project_tree.item(sel[0], 'values')
         job_number = vals[0]
-        open_add_note_dialog(self.root, str(job_number))
+        open_add_note_dialog(self.root, str(job_number), conn=self.conn)
     
     def load_current_drawings(self):
         """Load drawings for the current project"""
         if not self.current_project:
             return
         
-        try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                SELECT drawing_name, drawing_type, drawing_path, file_extension, COALESCE(printed,0)
-                FROM drawings 
-                WHERE job_number = ?
-                ORDER BY drawing_name
-            """, (self.current_project,))
-            
-            drawings = cursor.fetchall()
-            
-            # Clear existing items
-            for item in self.current_drawings_tree.get_children():
-                self.current_drawings_tree.delete(item)
-            
-            # Add drawings to tree
-            for drawing in drawings:
-                drawing_name, drawing_type, drawing_path, file_extension, printed = drawing
-                display_type = drawing_type or file_extension or "Unknown"
-                
-                # Add to tree with action text
-                item = self.current_drawings_tree.insert('', 'end', values=(
-                    '✅' if printed else '☐',
-                    drawing_name,
-                    display_type,
-                    drawing_path,
-                    "Open | Print | Delete"  # Action text
-                ))
-                
-                # Store the drawing path for later use
-                self.current_drawings_tree.set(item, 'Actions', 'Open | Print | Delete')
-            
-        except Exception as e:
-            print(f"Error loading current drawings: {e}")
+        job_number = self.current_project
+        
+        def query(conn):
+            # The statement already yields the display rows (with action text)
+            return conn.execute(self._SQL_LOAD_CURRENT,
+                                (self.PRINTED_ON, self.PRINTED_OFF, job_number)).fetchall()
+        
+        self.run_db_async(query, lambda rows: self._show_current_drawings(job_number, rows),
+                          "loading current drawings")
+    
+    def _show_current_drawings(self, job_number, rows):
+        """Fill the current drawings tree, unless another project was selected meanwhile"""
+        if job_number != self.current_project:
+            return
+        
+        # Clear existing items
+        self.current_drawings_tree.delete(*self.current_drawings_tree.get_children())
+        
+        # Add drawings to tree, remembering each row's path so handlers
+        # don't have to read it back out of the widget
+        insert = self.current_drawings_tree.insert
+        self._current_path_by_iid = {insert('', 'end', values=values): values[3] for values in rows}
+        # Rows shown as printed, so a click can toggle without reading the cell back
+        self._current_printed_iids = {row_id for row_id, values in zip(self._current_path_by_iid, rows)
+                                      if values[0] == self.PRINTED_ON}
+    
+    def _schedule_global_search(self, *args):
+        """Debounce global search keystrokes so a burst of typing runs one query"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self._run_global_search)
+    
+    def _run_global_search(self):
+        self._search_after_id = None
+        if self.global_search_var.get().lower() == self._last_global_search_term:
+            return
+        self.search_global_drawings()
     
     def search_global_drawings(self, *args):
         """Search for drawings globally across all jobs"""
         search_term = self.global_search_var.get().lower()
+        self._last_global_search_term = search_term
+        
+        # Results from an older search are dropped when they arrive
+        self._search_generation += 1
+        generation = self._search_generation
         
-        if not search_term:
+        # Short terms match nearly every drawing; wait for 3 or more characters
+        if len(search_term) < 3:
             # Clear global search results
-            for item in self.global_drawings_tree.get_children():
-                self.global_drawings_tree.delete(item)
+            self._global_rows = []
+            self._global_rendered = 0
+            self._global_row_meta = {}
+            self.global_drawings_tree.delete(*self.global_drawings_tree.get_children())
             return
         
-        try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                SELECT job_number, drawing_name, drawing_type, drawing_path, file_extension
-                FROM drawings 
-                WHERE LOWER(drawing_name) LIKE ? OR LOWER(drawing_path) LIKE ?
-                ORDER BY job_number, drawing_name
-            """, (f'%{search_term}%', f'%{search_term}%'))
-            
-            drawings = cursor.fetchall()
-            
-            # Clear existing items
-            for item in self.global_drawings_tree.get_children():
-                self.global_drawings_tree.delete(item)
-            
-            # Add drawings to tree
-            for drawing in drawings:
-                job_number, drawing_name, drawing_type, drawing_path, file_extension = drawing
-                display_type = drawing_type or file_extension or "Unknown"
-                
-                # Add to tree
-                self.global_drawings_tree.insert('', 'end', values=(
-                    job_number,
-                    drawing_name,
-                    display_type,
-                    drawing_path,
-                    ""  # Actions column
-                ))
-            
-        except Exception as e:
-            print(f"Error searching global drawings: {e}")
+        if self.drawings_fts_enabled:
+            # One quoted phrase, so the whole term matches as a single substring
+            sql = self._SQL_GLOBAL_SEARCH_FTS
+            params = ('"' + search_term.replace('"', '""') + '"',)
+        else:
+            sql = self._SQL_GLOBAL_SEARCH_LIKE
+            # LIKE already ignores ASCII case; escape its wildcards so "_" in
+            # names like "J1_DWG" matches only an underscore
+            pattern = '%' + search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            params = (pattern, pattern)
+        
+        # One extra row tells whether the results were cut off
+        params += (self._GLOBAL_RESULT_LIMIT + 1,)
+        
+        def query(conn):
+            return conn.execute(sql, params).fetchall()
+        
+        self.run_db_async(query, lambda results: self._show_global_results(generation, results),
+                          "searching global drawings")
+    
+    def _show_global_results(self, generation, results):
+        """Fill the global results tree, unless a newer search has started since"""
+        if generation != self._search_generation:
+            return
+        
+        # Build display rows before touching the widget ("" is the Actions column),
+        # keeping the raw columns alongside so "Add to Current Job" needn't re-query
+        truncated = len(results) > self._GLOBAL_RESULT_LIMIT
+        self._global_rows = [
+            ((job_number, drawing_name, drawing_type or file_extension or "Unknown", drawing_path, ""),
+             (drawing_path, drawing_name, drawing_type, file_extension))
+            for job_number, drawing_name, drawing_type, drawing_path, file_extension
+            in results[:self._GLOBAL_RESULT_LIMIT]
+        ]
+        if truncated:
+            # Marker row with no drawing behind it (so it has no row meta)
+            self._global_rows.append(
+                (("", f"… first {self._GLOBAL_RESULT_LIMIT} matches shown, refine the search", "", "", ""), None))
+        self._global_rendered = 0
+        self._global_row_meta = {}
+        
+        # Clear existing items
+        self.global_drawings_tree.delete(*self.global_drawings_tree.get_children())
+        
+        # Small result sets go in at once; large ones start with the first page
+        if len(self._global_rows) <= self._GLOBAL_RENDER_THRESHOLD:
+            self._render_more_global_results(len(self._global_rows))
+        else:
+            self._render_more_global_results()
+    
+    def _render_more_global_results(self, count=None):
+        """Insert the next page of global search rows that aren't in the tree yet"""
+        start = self._global_rendered
+        if start >= len(self._global_rows):
+            return
+        end = start + (count or self._GLOBAL_RENDER_CHUNK)
+        
+        insert = self.global_drawings_tree.insert
+        row_meta = self._global_row_meta
+        for values, meta in self._global_rows[start:end]:
+            item_id = insert('', 'end', values=values)
+            if meta:
+                row_meta[item_id] = meta
+        self._global_rendered = min(end, len(self._global_rows))
     
     def browse_drawing(self):
         """Browse for a drawing file"""
         filename = filedialog.askopenfilename(
             title="Select Drawing File",
-            filetypes=[
-                ("Drawing files", "*.dwg *.idw *.pdf"),
-                ("AutoCAD files", "*.dwg"),
-                ("Inventor files", "*.idw"),
-                ("PDF files", "*.pdf"),
-                ("All files", "*.*")
-            ]
+            filetypes=DRAWING_FILETYPES
         )
         
         if filename:
@@ -605,47 +1233,39 @@ class PrintPackageApp:
         # Normalize the path to handle different path formats
         drawing_path = os.path.normpath(drawing_path)
         
-        if not os.path.exists(drawing_path):
+        # One stat; a missing file (or an unreachable share) raises instead of
+        # needing a separate exists() check
+        try:
+            os.stat(drawing_path)
+        except OSError:
             # Try to provide more helpful error message
             error_msg = f"Drawing file does not exist:\n{drawing_path}\n\nPlease check the file path and try again."
             messagebox.showerror("Error", error_msg)
             return
         
         try:
-            cursor = self.conn.cursor()
-            
-            # Extract drawing information
-            drawing_name = os.path.basename(drawing_path)
-            file_extension = os.path.splitext(drawing_path)[1].lower()
+            # Extract drawing information (path is already normalized, so split on os.sep)
+            drawing_name = drawing_path.rsplit(os.sep, 1)[-1]
+            stem, dot, ext = drawing_name.rpartition('.')
+            file_extension = (dot + ext).lower() if stem else ''
             
             # Determine drawing type based on extension
-            if file_extension == '.dwg':
-                drawing_type = 'AutoCAD'
-            elif file_extension == '.idw':
-                drawing_type = 'Inventor'
-            elif file_extension == '.pdf':
-                drawing_type = 'PDF'
-            else:
-                drawing_type = 'Other'
+            drawing_type = DRAWING_TYPES.get(file_extension, 'Other')
             
-            # Insert drawing
-            cursor.execute("""
-                INSERT INTO drawings (job_number, drawing_path, drawing_name, drawing_type, 
-                                   file_extension, added_date, added_by)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (self.current_project, drawing_path, drawing_name, drawing_type, 
-                  file_extension, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "User"))
+            # Insert drawing (one that's already in the job is skipped)
+            added_count = self.add_drawings_bulk([
+                (self.current_project, drawing_path, drawing_name, drawing_type, file_extension, "User")
+            ])
             
-            self.conn.commit()
+            if added_count == 0:
+                messagebox.showinfo("Info", "This drawing is already in the current job")
+                return
             
             # Clear the path entry
             self.drawing_path_var.set("")
             
-            # Refresh the current drawings list
-            self.load_current_drawings()
-            
-            # Refresh the project list to update drawing counts
-            self.load_projects()
+            # Refresh the drawings list and this project's count (coalesced into one pass)
+            self.request_refresh(self.current_project)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add drawing: {str(e)}")
@@ -653,10 +1273,10 @@ class PrintPackageApp:
     def open_drawing(self, drawing_path):
         """Open a drawing file"""
         try:
-            if os.path.exists(drawing_path):
-                os.startfile(drawing_path)
-            else:
-                messagebox.showerror("Error", "Drawing file not found")
+            # startfile raises for a missing file, so no separate exists() stat is needed
+            os.startfile(drawing_path)
+        except FileNotFoundError:
+            messagebox.showerror("Error", "Drawing file not found")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open drawing: {str(e)}")
     
@@ -664,37 +1284,64 @@ class PrintPackageApp:
         """Print a drawing file directly to the correct printer"""
         try:
             if os.path.exists(drawing_path):
-                # Detect paper size and get appropriate printer
+                # Detect paper size, then print once its printer is known
                 paper_size = self.detect_paper_size_from_drawing(drawing_path)
-                printer_name = self.get_printer_for_size(paper_size)
+                self._resolve_printers((paper_size,), lambda printers: self._print_drawing_to(
+                    drawing_path, paper_size, printers[paper_size]))
+            else:
+                messagebox.showerror("Error", "Drawing file not found")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to print drawing: {str(e)}")
+    
+    def _print_drawing_to(self, drawing_path, paper_size, printer_name):
+        """Finish print_drawing once the drawing's printer is known"""
+        try:
+            if printer_name:
+                # Ask for quantity
+                quantity = self.get_print_quantity()
+                if quantity is None:  # User cancelled
+                    return
                 
-                if printer_name:
-                    # Ask for quantity
-                    quantity = self.get_print_quantity()
-                    if quantity is None:  # User cancelled
-                        return
-                    
-                    # Print directly to the configured printer
+                # Print directly to the configured printer
+                if os.path.splitext(drawing_path)[1].lower() in ('.dwg', '.idw'):
+                    # These drive AutoCAD/Inventor and show dialogs, so print them here
                     success = self.print_file_direct(drawing_path, printer_name, quantity)
-                    
-                    if success:
-                        print(f"Printed {quantity} copies of {os.path.basename(drawing_path)} (Size {paper_size}) to {printer_name}")
-                        messagebox.showinfo("Success", 
-                                          f"Successfully printed {quantity} copies of {os.path.basename(drawing_path)} to {printer_name}")
-                    else:
-                        messagebox.showerror("Error", f"Failed to print {os.path.basename(drawing_path)}")
+                    self._report_print_drawing(success, drawing_path, quantity, paper_size, printer_name)
                 else:
-                    messagebox.showinfo("Info", "Print cancelled - no printer selected")
+                    # Spool on the print pool so the window stays responsive meanwhile
+                    future = self._print_pool.submit(self.print_file_direct, drawing_path, printer_name, quantity)
+                    self.root.after(100, self._finish_print_drawing, future, drawing_path,
+                                    quantity, paper_size, printer_name)
             else:
-                messagebox.showerror("Error", "Drawing file not found")
+                messagebox.showinfo("Info", "Print cancelled - no printer selected")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to print drawing: {str(e)}")
     
+    def _finish_print_drawing(self, future, drawing_path, quantity, paper_size, printer_name):
+        """Poll a single print job from the Tk loop and report it once done"""
+        if not future.done():
+            self.root.after(100, self._finish_print_drawing, future, drawing_path,
+                            quantity, paper_size, printer_name)
+            return
+        try:
+            success = future.result()
+        except Exception as e:
+            print(f"Failed to print {drawing_path}: {e}")
+            success = False
+        self._report_print_drawing(success, drawing_path, quantity, paper_size, printer_name)
+    
+    def _report_print_drawing(self, success, drawing_path, quantity, paper_size, printer_name):
+        drawing_name = os.path.basename(drawing_path)
+        if success:
+            print(f"Printed {quantity} copies of {drawing_name} (Size {paper_size}) to {printer_name}")
+            messagebox.showinfo("Success", 
+                              f"Successfully printed {quantity} copies of {drawing_name} to {printer_name}")
+        else:
+            messagebox.showerror("Error", f"Failed to print {drawing_name}")
+    
     def get_print_quantity(self):
         """Get print quantity from user"""
         try:
-            from tkinter import simpledialog
-            
             quantity = simpledialog.askinteger(
                 "Print Quantity",
                 "How many copies would you like to print?",
@@ -736,7 +1383,7 @@ class PrintPackageApp:
             
             # Try to use AutoCAD to print
             try:
-                import win32api
+                _require_win32()
                 
                 # Try to open with AutoCAD and print
                 result = win32api.ShellExecute(
@@ -773,7 +1420,7 @@ class PrintPackageApp:
             print(f"Opening {os.path.basename(idw_path)} in Inventor for manual printing...")
             
             # Just open the file in Inventor - let user handle the printing
-            import win32api
+            _require_win32()
             
             result = win32api.ShellExecute(
                 0,  # hwnd
@@ -809,7 +1456,7 @@ class PrintPackageApp:
         """Print other file types (PDF, etc.) using Windows Shell"""
         try:
             # Use Windows Shell to print file directly
-            import win32api
+            _require_win32()
             
             # Print multiple copies
             for i in range(quantity):
@@ -833,17 +1480,16 @@ class PrintPackageApp:
         except ImportError:
             # Fallback: Use subprocess
             try:
-                for i in range(quantity):
-                    result = subprocess.run([
-                        'cmd', '/c', 'print', f'/d:"{printer_name}"', file_path
-                    ], check=False, capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        print(f"Successfully printed copy {i+1}/{quantity} to {printer_name}")
-                    else:
-                        print(f"Print command failed for copy {i+1}: {result.stderr}")
-                        return False
-                return True
+                # PRINT takes several files, so all copies go in one command
+                result = subprocess.run([
+                    'cmd', '/c', 'print', f'/d:"{printer_name}"', *([file_path] * quantity)
+                ], check=False, capture_output=True, text=True)
+                
+                if result.returncode == 0:
+                    print(f"Successfully printed {quantity} copies to {printer_name}")
+                    return True
+                print(f"Print command failed: {result.stderr}")
+                return False
             except Exception as e:
                 print(f"Subprocess print failed: {e}")
                 return False
@@ -853,58 +1499,86 @@ class PrintPackageApp:
     
     def convert_drawing_to_pdf(self, drawing_path, paper_size):
         """Convert drawing file to PDF and save in job folder"""
+        pdf_path = self._pdf_export_path(drawing_path)
+        if not pdf_path:
+            return None
+        return self._write_drawing_pdf(drawing_path, pdf_path, paper_size, self.current_project)
+    
+    def _pdf_export_path(self, drawing_path):
+        """Return where drawing_path's PDF goes in the current job's export folder
+        
+        This is the part of a conversion that uses the DB and may show dialogs, so
+        it runs on the Tk thread; _write_drawing_pdf can then run on the print pool.
+        """
         try:
             if not self.current_project:
                 messagebox.showwarning("Warning", "No project selected")
                 return None
             
-            # Get job directory
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT job_directory FROM projects WHERE job_number = ?", (self.current_project,))
-            job_dir_result = cursor.fetchone()
+            # Only DWG/IDW placeholders and PDF copies are supported
+            file_ext = os.path.splitext(drawing_path)[1].lower()
+            if file_ext not in ('.dwg', '.idw', '.pdf'):
+                messagebox.showerror("Error", f"Unsupported file type: {file_ext}")
+                return None
             
-            if not job_dir_result or not job_dir_result[0]:
+            # Get job directory (cached per job, shared with package export)
+            job_directory = self.get_export_directory(self.current_project)
+            if not job_directory:
                 messagebox.showwarning("Warning", "Job directory not found")
                 return None
             
-            job_directory = job_dir_result[0]
-            
             # Create PDF export folder
+            # (checked once per folder; exist_ok covers a folder created meanwhile)
             pdf_folder = os.path.join(job_directory, f"{self.current_project}-Supporting BOM Drawing Package Exports")
-            if not os.path.exists(pdf_folder):
-                os.makedirs(pdf_folder, exist_ok=True)
-                print(f"Created PDF export folder: {pdf_folder}")
+            if pdf_folder not in self._pdf_folders_ready:
+                if not os.path.isdir(pdf_folder):
+                    os.makedirs(pdf_folder, exist_ok=True)
+                    print(f"Created PDF export folder: {pdf_folder}")
+                self._pdf_folders_ready.add(pdf_folder)
             
             # Generate PDF filename
             drawing_name = os.path.splitext(os.path.basename(drawing_path))[0]
             pdf_filename = f"{self.current_project}-{drawing_name}.pdf"
-            pdf_path = os.path.join(pdf_folder, pdf_filename)
-            
-            # Check if PDF already exists
-            if os.path.exists(pdf_path):
-                print(f"PDF already exists: {pdf_path}")
-                return pdf_path
+            return os.path.join(pdf_folder, pdf_filename)
+                
+        except Exception as e:
+            print(f"Error converting drawing to PDF: {e}")
+            return None
+    
+    def _write_drawing_pdf(self, drawing_path, pdf_path, paper_size, job_number):
+        """Write pdf_path for drawing_path and return it, or None on failure (no Tk calls)"""
+        try:
+            # Reuse an earlier conversion unless the drawing has changed since it
+            # was made (two stats instead of rebuilding the PDF every time)
+            try:
+                pdf_mtime = os.stat(pdf_path).st_mtime
+            except OSError:
+                pdf_mtime = None
+            if pdf_mtime is not None:
+                try:
+                    source_mtime = os.stat(drawing_path).st_mtime
+                except OSError:
+                    source_mtime = None
+                if source_mtime is None or pdf_mtime >= source_mtime:
+                    print(f"PDF already exists: {pdf_path}")
+                    return pdf_path
+                print(f"Drawing changed since {pdf_path} was created, converting again")
             
             # Get file extension
             file_ext = os.path.splitext(drawing_path)[1].lower()
             
-            if file_ext == '.dwg':
-                # Convert AutoCAD drawing to PDF using Windows print to PDF
-                success = self.print_dwg_to_pdf(drawing_path, pdf_path, paper_size)
-            elif file_ext == '.idw':
-                # Convert Inventor drawing to PDF using Windows print to PDF
-                success = self.print_idw_to_pdf(drawing_path, pdf_path, paper_size)
-            elif file_ext == '.pdf':
+            if file_ext == '.pdf':
                 # Already a PDF, just copy it
-                import shutil
-                shutil.copy2(drawing_path, pdf_path)
+                _copy_file(drawing_path, pdf_path)
                 success = True
             else:
-                # Unsupported file type
-                messagebox.showerror("Error", f"Unsupported file type: {file_ext}")
-                return None
+                # AutoCAD/Inventor drawings get a placeholder PDF for now
+                success = self._render_placeholder_pdf(drawing_path, pdf_path, paper_size,
+                                                       file_ext[1:].upper(), job_number)
             
-            if success and os.path.exists(pdf_path):
+            # Both writers only report success once pdf_path is in place, so there
+            # is no stat to confirm it (one network round trip per drawing)
+            if success:
                 print(f"Successfully created PDF: {pdf_path}")
                 return pdf_path
             else:
@@ -915,156 +1589,59 @@ class PrintPackageApp:
             print(f"Error converting drawing to PDF: {e}")
             return None
     
-    def print_dwg_to_pdf(self, dwg_path, pdf_path, paper_size):
-        """Print DWG file to PDF and save to specified location"""
+    def _print_converted_pdf(self, conversion, pdf_path, printer_name):
+        """Print-pool job: wait for an earlier job's conversion of pdf_path, then print it
+        
+        The pool runs jobs in submission order, so the conversion is already
+        running or done by the time this starts.
+        """
         try:
-            print(f"Printing {os.path.basename(dwg_path)} to PDF...")
-            
-            # For now, let's use a simpler approach - just copy the DWG and rename it
-            # This is a placeholder until we can implement proper PDF conversion
-            import shutil
-            
-            # Create a temporary PDF file with drawing info
-            temp_pdf = pdf_path.replace('.pdf', '_temp.pdf')
-            
-            try:
-                from reportlab.lib.pagesizes import letter, legal, A4
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.units import inch
-                
-                # Get paper size dimensions
-                size_dimensions = {
-                    'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                    'B': (17, 11),     # 11T x 17W (landscape) 
-                    'C': (24, 18),     # 18T x 24W (landscape)
-                    'D': (36, 24)      # 24T x 36W (landscape)
-                }
-                
-                width, height = size_dimensions.get(paper_size, (11, 8.5))
-                
-                # Create PDF with drawing info
-                c = canvas.Canvas(temp_pdf, pagesize=(width * inch, height * inch))
-                
-                # Add content
-                c.setFont("Helvetica-Bold", 24)
-                c.drawString(1 * inch, height * inch - 1.5 * inch, f"DRAWING: {os.path.basename(dwg_path)}")
-                
-                c.setFont("Helvetica", 16)
-                c.drawString(1 * inch, height * inch - 2.5 * inch, f"Original File: {dwg_path}")
-                c.drawString(1 * inch, height * inch - 3 * inch, f"Paper Size: {paper_size} ({width}\" x {height}\")")
-                c.drawString(1 * inch, height * inch - 3.5 * inch, f"Converted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                c.drawString(1 * inch, height * inch - 4 * inch, f"Job Number: {self.current_project}")
-                c.drawString(1 * inch, height * inch - 4.5 * inch, f"NOTE: This is a placeholder PDF. The actual drawing")
-                c.drawString(1 * inch, height * inch - 5 * inch, f"should be opened and printed manually.")
-                
-                # Add border
-                c.rect(0.5 * inch, 0.5 * inch, (width - 1) * inch, (height - 1) * inch)
-                
-                # Add corner marks
-                corner_size = 0.5 * inch
-                c.rect(0.5 * inch, 0.5 * inch, corner_size, corner_size)
-                c.rect((width - 1) * inch, 0.5 * inch, corner_size, corner_size)
-                c.rect(0.5 * inch, (height - 1) * inch, corner_size, corner_size)
-                c.rect((width - 1) * inch, (height - 1) * inch, corner_size, corner_size)
-                
-                c.save()
-                
-                # Move to final location
-                shutil.move(temp_pdf, pdf_path)
-                print(f"Created PDF placeholder: {pdf_path}")
-                return True
-                
-            except ImportError:
-                # Fallback: create a simple text file
-                txt_path = pdf_path.replace('.pdf', '.txt')
-                with open(txt_path, 'w') as f:
-                    f.write(f"DRAWING: {os.path.basename(dwg_path)}\n")
-                    f.write(f"Original File: {dwg_path}\n")
-                    f.write(f"Paper Size: {paper_size}\n")
-                    f.write(f"Converted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Job Number: {self.current_project}\n")
-                    f.write(f"NOTE: This is a placeholder. The actual drawing should be opened and printed manually.\n")
-                print(f"Created text placeholder: {txt_path}")
-                return True
-            
-        except Exception as e:
-            print(f"Error creating DWG PDF: {e}")
+            conversion.result()
+        except Exception:
+            pass
+        if not os.path.exists(pdf_path):
             return False
+        return self.print_pdf_file(pdf_path, printer_name)
     
-    def print_idw_to_pdf(self, idw_path, pdf_path, paper_size):
-        """Print IDW file to PDF and save to specified location"""
+    def _convert_and_print_pdf(self, drawing_path, pdf_path, paper_size, job_number, printer_name):
+        """Print-pool job: write the drawing's PDF, then send it to printer_name"""
+        if not self._write_drawing_pdf(drawing_path, pdf_path, paper_size, job_number):
+            print(f"Failed to convert {os.path.basename(drawing_path)} to PDF")
+            return False
+        return self.print_pdf_file(pdf_path, printer_name)
+    
+    def _render_placeholder_pdf(self, drawing_path, pdf_path, paper_size, kind, job_number):
+        """Write the placeholder PDF for a DWG/IDW drawing"""
         try:
-            print(f"Printing {os.path.basename(idw_path)} to PDF...")
-            
-            # For now, let's use a simpler approach - just copy the IDW and rename it
-            # This is a placeholder until we can implement proper PDF conversion
-            import shutil
+            print(f"Printing {os.path.basename(drawing_path)} to PDF...")
             
-            # Create a temporary PDF file with drawing info
-            temp_pdf = pdf_path.replace('.pdf', '_temp.pdf')
+            # Create a temporary PDF file with drawing info, next to the target and
+            # named per thread, so two writers of the same PDF never share one
+            temp_pdf = f"{pdf_path}.{threading.get_ident()}.tmp"
             
-            try:
-                from reportlab.lib.pagesizes import letter, legal, A4
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.units import inch
-                
-                # Get paper size dimensions
-                size_dimensions = {
-                    'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                    'B': (17, 11),     # 11T x 17W (landscape) 
-                    'C': (24, 18),     # 18T x 24W (landscape)
-                    'D': (36, 24)      # 24T x 36W (landscape)
-                }
-                
-                width, height = size_dimensions.get(paper_size, (11, 8.5))
-                
-                # Create PDF with drawing info
-                c = canvas.Canvas(temp_pdf, pagesize=(width * inch, height * inch))
-                
-                # Add content
-                c.setFont("Helvetica-Bold", 24)
-                c.drawString(1 * inch, height * inch - 1.5 * inch, f"DRAWING: {os.path.basename(idw_path)}")
-                
-                c.setFont("Helvetica", 16)
-                c.drawString(1 * inch, height * inch - 2.5 * inch, f"Original File: {idw_path}")
-                c.drawString(1 * inch, height * inch - 3 * inch, f"Paper Size: {paper_size} ({width}\" x {height}\")")
-                c.drawString(1 * inch, height * inch - 3.5 * inch, f"Converted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                c.drawString(1 * inch, height * inch - 4 * inch, f"Job Number: {self.current_project}")
-                c.drawString(1 * inch, height * inch - 4.5 * inch, f"NOTE: This is a placeholder PDF. The actual drawing")
-                c.drawString(1 * inch, height * inch - 5 * inch, f"should be opened and printed manually.")
-                
-                # Add border
-                c.rect(0.5 * inch, 0.5 * inch, (width - 1) * inch, (height - 1) * inch)
-                
-                # Add corner marks
-                corner_size = 0.5 * inch
-                c.rect(0.5 * inch, 0.5 * inch, corner_size, corner_size)
-                c.rect((width - 1) * inch, 0.5 * inch, corner_size, corner_size)
-                c.rect(0.5 * inch, (height - 1) * inch, corner_size, corner_size)
-                c.rect((width - 1) * inch, (height - 1) * inch, corner_size, corner_size)
-                
-                c.save()
-                
-                # Move to final location
-                shutil.move(temp_pdf, pdf_path)
-                print(f"Created PDF placeholder: {pdf_path}")
-                return True
-                
-            except ImportError:
-                # Fallback: create a simple text file
-                txt_path = pdf_path.replace('.pdf', '.txt')
-                with open(txt_path, 'w') as f:
-                    f.write(f"DRAWING: {os.path.basename(idw_path)}\n")
-                    f.write(f"Original File: {idw_path}\n")
-                    f.write(f"Paper Size: {paper_size}\n")
-                    f.write(f"Converted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Job Number: {self.current_project}\n")
-                    f.write(f"NOTE: This is a placeholder. The actual drawing should be opened and printed manually.\n")
-                print(f"Created text placeholder: {txt_path}")
-                return True
+            # Get paper size dimensions
+            width, height = PAPER_SIZES.get(paper_size, DEFAULT_PAPER_SIZE)
+            layout = PAGE_LAYOUTS.get(paper_size, PAGE_LAYOUTS['A'])
+            
+            # Create PDF with drawing info
+            with open(temp_pdf, 'wb') as f:
+                f.write(_info_page_pdf(layout, f"DRAWING: {os.path.basename(drawing_path)}", (
+                    f"Original File: {drawing_path}",
+                    f"Paper Size: {paper_size} ({width}\" x {height}\")",
+                    f"Converted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"Job Number: {job_number}",
+                    "NOTE: This is a placeholder PDF. The actual drawing",
+                    "should be opened and printed manually.",
+                )))
+            
+            # Publish in one rename; replaces a stale PDF in place, where a move
+            # onto an existing file would fall back to copy and delete on Windows
+            os.replace(temp_pdf, pdf_path)
+            print(f"Created PDF placeholder: {pdf_path}")
+            return True
             
         except Exception as e:
-            print(f"Error creating IDW PDF: {e}")
+            print(f"Error creating {kind} PDF: {e}")
             return False
     
     def convert_autocad_to_pdf(self, dwg_path, pdf_path, paper_size):
@@ -1075,8 +1652,7 @@ class PrintPackageApp:
             # Use Windows Shell to print DWG directly to PDF
             # This will use the default PDF printer and create a proper PDF
             try:
-                import win32api
-                import win32print
+                _require_win32()
                 
                 # Print the DWG file directly to PDF using Windows Shell
                 result = win32api.ShellExecute(
@@ -1124,8 +1700,7 @@ class PrintPackageApp:
             # Use Windows Shell to print IDW directly to PDF
             # This will use the default PDF printer and create a proper PDF
             try:
-                import win32api
-                import win32print
+                _require_win32()
                 
                 # Print the IDW file directly to PDF using Windows Shell
                 result = win32api.ShellExecute(
@@ -1167,28 +1742,14 @@ class PrintPackageApp:
     
     def get_paper_dimensions(self, paper_size):
         """Get paper dimensions as a string"""
-        size_dimensions = {
-            'A': (11, 8.5),    # 8.5T x 11W (landscape)
-            'B': (17, 11),     # 11T x 17W (landscape) 
-            'C': (24, 18),     # 18T x 24W (landscape)
-            'D': (36, 24)      # 24T x 36W (landscape)
-        }
-        
-        width, height = size_dimensions.get(paper_size, (11, 8.5))
+        width, height = PAPER_SIZES.get(paper_size, DEFAULT_PAPER_SIZE)
         return f"{width}\" x {height}\""
     
     def print_autocad_drawing(self, dwg_path, printer_name, paper_size):
         """Print AutoCAD drawing with proper settings - fit to paper"""
         try:
             # Get paper size dimensions (width x height in inches)
-            size_dimensions = {
-                'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                'B': (17, 11),     # 11T x 17W (landscape) 
-                'C': (24, 18),     # 18T x 24W (landscape)
-                'D': (36, 24)      # 24T x 36W (landscape)
-            }
-            
-            width, height = size_dimensions.get(paper_size, (11, 8.5))
+            width, height = PAPER_SIZES.get(paper_size, DEFAULT_PAPER_SIZE)
             
             # Create AutoCAD script for printing with fit to paper
             script_content = f"""
@@ -1267,14 +1828,7 @@ Y
         """Print Inventor drawing with proper settings - fit to paper"""
         try:
             # Get paper size dimensions (width x height in inches)
-            size_dimensions = {
-                'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                'B': (17, 11),     # 11T x 17W (landscape) 
-                'C': (24, 18),     # 18T x 24W (landscape)
-                'D': (36, 24)      # 24T x 36W (landscape)
-            }
-            
-            width, height = size_dimensions.get(paper_size, (11, 8.5))
+            width, height = PAPER_SIZES.get(paper_size, DEFAULT_PAPER_SIZE)
             
             # Create Inventor script for printing with fit to paper
             script_content = f"""
@@ -1344,6 +1898,9 @@ Y
     def print_generic_file(self, file_path, printer_name):
         """Generic file printing fallback"""
         try:
+            spooled = _print_raw(file_path, printer_name)
+            if spooled is not None:
+                return spooled
             result = subprocess.run(['cmd', '/c', 'print', f'/d:{printer_name}', file_path], 
                                   check=False, capture_output=True, text=True)
             return result.returncode == 0
@@ -1354,18 +1911,10 @@ Y
     def print_with_windows_shell(self, file_path, printer_name, paper_size):
         """Print using Windows Shell API for better compatibility"""
         try:
-            import win32api
-            import win32print
+            _require_win32()
             
             # Get paper size dimensions
-            size_dimensions = {
-                'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                'B': (17, 11),     # 11T x 17W (landscape) 
-                'C': (24, 18),     # 18T x 24W (landscape)
-                'D': (36, 24)      # 24T x 36W (landscape)
-            }
-            
-            width, height = size_dimensions.get(paper_size, (11, 8.5))
+            width, height = PAPER_SIZES.get(paper_size, DEFAULT_PAPER_SIZE)
             
             # Use Windows Shell to print
             win32api.ShellExecute(
@@ -1385,62 +1934,61 @@ Y
             print(f"Error printing with Windows Shell: {e}")
             return self.print_generic_file(file_path, printer_name)
     
-    def get_printer_name(self):
-        """Get printer name from user or use default"""
+    def get_printer_name(self, on_choice):
+        """Ask for a printer: the default one, another one, or PDF
+        
+        Doesn't wait for the answer; on_choice(printer_name) is called with it,
+        or with None if the printer picker is cancelled.
+        """
         try:
             # Try to get default printer
-            import win32print
+            _require_win32()
             default_printer = win32print.GetDefaultPrinter()
-            
-            # Ask user if they want to use default printer or choose another
-            choice = messagebox.askyesnocancel(
-                "Print Options",
-                f"Default printer: {default_printer}\n\n"
-                f"Yes = Use Default Printer\n"
-                f"No = Choose Different Printer\n"
-                f"Cancel = Print to PDF"
-            )
-            
-            if choice is True:  # Use default printer
-                return default_printer
-            elif choice is False:  # Choose different printer
-                return self.choose_printer()
-            else:  # Cancel - print to PDF
-                return "Microsoft Print to PDF"
-                
         except ImportError:
             # Fallback if win32print not available
-            return self.choose_printer()
+            self.choose_printer(on_choice)
+            return
         except Exception as e:
             print(f"Error getting default printer: {e}")
-            return self.choose_printer()
+            self.choose_printer(on_choice)
+            return
+        
+        def on_action(action):
+            if action == 'default':  # Use default printer
+                on_choice(default_printer)
+            elif action == 'choose':  # Choose different printer
+                self.choose_printer(on_choice)
+            else:  # Print to PDF, also when the window is closed (as Cancel was)
+                on_choice("Microsoft Print to PDF")
+        
+        # Ask user if they want to use default printer or choose another
+        self._ask_choice("Print Options", f"Default printer: {default_printer}", (
+            ('default', "Use Default Printer"),
+            ('choose', "Choose Different Printer"),
+            ('pdf', "Print to PDF"),
+        ), on_action)
     
-    def choose_printer(self):
-        """Let user choose a printer"""
+    def choose_printer(self, on_choice):
+        """Let user choose a printer
+        
+        Like _ask_choice, the dialog isn't waited on: on_choice(printer_name) is
+        called once a button is pressed, with None for Cancel or when the window
+        is closed, so print jobs and after() callbacks keep running meanwhile.
+        """
         try:
-            import win32print
-            
             # Get list of available printers
-            printers = []
-            for printer in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS):
-                printers.append(printer[2])  # printer[2] is the printer name
+            printers = _enum_printers()
             
             if not printers:
                 messagebox.showwarning("Warning", "No printers found. Using PDF printer.")
-                return "Microsoft Print to PDF"
+                on_choice("Microsoft Print to PDF")
+                return
             
             # Create a simple printer selection dialog
             printer_window = tk.Toplevel(self.root)
             printer_window.title("Select Printer")
-            printer_window.geometry("400x300")
+            printer_window.geometry(self._centered_geometry(400, 300))
             printer_window.transient(self.root)
-            printer_window.grab_set()
-            
-            # Center the window
-            printer_window.update_idletasks()
-            x = (printer_window.winfo_screenwidth() // 2) - (400 // 2)
-            y = (printer_window.winfo_screenheight() // 2) - (300 // 2)
-            printer_window.geometry(f"400x300+{x}+{y}")
             
             selected_printer = tk.StringVar(value=printers[0])
             
@@ -1453,8 +2001,8 @@ Y
             printer_listbox = tk.Listbox(printer_frame, font=("Arial", 10))
             printer_listbox.pack(fill=tk.BOTH, expand=True)
             
-            for printer in printers:
-                printer_listbox.insert(tk.END, printer)
+            # One Tcl call for the whole list
+            printer_listbox.insert(tk.END, *printers)
             
             # Bind selection
             def on_select(event):
@@ -1468,35 +2016,29 @@ Y
             button_frame = ttk.Frame(printer_window)
             button_frame.pack(fill=tk.X, padx=20, pady=10)
             
-            result = [None]  # Use list to store result from nested function
-            
             def on_ok():
-                result[0] = selected_printer.get()
                 printer_window.destroy()
+                on_choice(selected_printer.get())
             
             def on_cancel():
-                result[0] = None
                 printer_window.destroy()
+                on_choice(None)
             
             def on_pdf():
-                result[0] = "Microsoft Print to PDF"
                 printer_window.destroy()
+                on_choice("Microsoft Print to PDF")
             
             ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.LEFT, padx=(0, 5))
             ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.LEFT, padx=(0, 5))
             ttk.Button(button_frame, text="Print to PDF", command=on_pdf).pack(side=tk.RIGHT)
-            
-            # Wait for window to close
-            printer_window.wait_window()
-            
-            return result[0]
+            printer_window.protocol("WM_DELETE_WINDOW", on_cancel)
             
         except ImportError:
             messagebox.showwarning("Warning", "Printer selection not available. Using PDF printer.")
-            return "Microsoft Print to PDF"
+            on_choice("Microsoft Print to PDF")
         except Exception as e:
             print(f"Error choosing printer: {e}")
-            return "Microsoft Print to PDF"
+            on_choice("Microsoft Print to PDF")
     
     def delete_drawing(self, drawing_path):
         """Delete a drawing from the current job"""
@@ -1505,18 +2047,19 @@ Y
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this drawing?"):
             try:
-                cursor = self.conn.cursor()
+                with self.conn:
+                    deleted = self.conn.execute("DELETE FROM drawings WHERE job_number = ? AND drawing_path = ?", 
+                                                (self.current_project, drawing_path)).rowcount
                 
-                cursor.execute("DELETE FROM drawings WHERE job_number = ? AND drawing_path = ?", 
-                             (self.current_project, drawing_path))
-                
-                self.conn.commit()
-                
-                # Refresh the current drawings list
-                self.load_current_drawings()
-                
-                # Refresh the project list to update drawing counts
-                self.load_projects()
+                if deleted:
+                    # Drop the row in place and refresh only this project's count,
+                    # rather than reloading the whole drawings list
+                    row_ids = [row_id for row_id, path in self._current_path_by_iid.items() if path == drawing_path]
+                    for row_id in row_ids:
+                        del self._current_path_by_iid[row_id]
+                        self._current_printed_iids.discard(row_id)
+                    self.current_drawings_tree.delete(*row_ids)
+                    self.refresh_project_counts([self.current_project])
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete drawing: {str(e)}")
@@ -1531,26 +2074,38 @@ Y
             col_id = self.current_drawings_tree.identify_column(event.x)
             if not row_id or col_id != '#1':  # '#1' corresponds to 'Printed' column
                 return
-            drawing_path = self.current_drawings_tree.set(row_id, 'Path')
-            current = self.current_drawings_tree.set(row_id, 'Printed')
-            new_state = 0 if current == '✅' else 1
-            cursor = self.conn.cursor()
-            cursor.execute("UPDATE drawings SET printed = ? WHERE job_number = ? AND drawing_path = ?", (new_state, self.current_project, drawing_path))
-            self.conn.commit()
-            # Update UI
-            self.current_drawings_tree.set(row_id, 'Printed', '✅' if new_state else '☐')
+            if row_id not in self._current_path_by_iid:
+                return
+            self._set_printed_bulk([row_id], row_id not in self._current_printed_iids)
         except Exception as e:
             print(f"Error toggling printed state: {e}")
 
+    def _set_printed_bulk(self, row_ids, printed):
+        """Mark the current drawings shown in row_ids printed or not
+        
+        All rows are written with one executemany in one transaction, and the
+        Printed cells are updated in place instead of reloading the list.
+        """
+        state = 1 if printed else 0
+        rows = [(state, self.current_project, self._current_path_by_iid[row_id]) for row_id in row_ids]
+        with self.conn:
+            self.conn.executemany("UPDATE drawings SET printed = ? WHERE job_number = ? AND drawing_path = ?", rows)
+        mark = self.PRINTED_ON if printed else self.PRINTED_OFF
+        for row_id in row_ids:
+            self.current_drawings_tree.set(row_id, 'Printed', mark)
+        if printed:
+            self._current_printed_iids.update(row_ids)
+        else:
+            self._current_printed_iids.difference_update(row_ids)
+
     def clear_all_printed(self):
         """Clear all printed checkboxes for the current job"""
         if not self.current_project:
             return
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("UPDATE drawings SET printed = 0 WHERE job_number = ?", (self.current_project,))
-            self.conn.commit()
-            self.load_current_drawings()
+            with self.conn:
+                self.conn.execute("UPDATE drawings SET printed = 0 WHERE job_number = ?", (self.current_project,))
+            self.request_refresh()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to clear checkboxes: {str(e)}")
     
@@ -1575,57 +2130,99 @@ Y
             if quantity is None:  # User cancelled
                 return
             
-            printed_count = 0
-            failed_count = 0
-            size_summary = {}
+            # Group the drawings by paper size so each size's printer is resolved
+            # once (the fallback asks the user, so it stays on the Tk thread)
+            drawings_by_size = {}
+            detect_paper_size = self.detect_paper_size_from_drawing
+            for drawing_path, in drawings:
+                drawings_by_size.setdefault(detect_paper_size(drawing_path), []).append(drawing_path)
+            
+            self._resolve_printers(drawings_by_size, lambda printers: self._submit_print_all(
+                drawings_by_size, printers, quantity))
             
-            # Print each drawing using size-based printer selection
-            for drawing in drawings:
-                drawing_path = drawing[0]
-                if os.path.exists(drawing_path):
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to print drawings: {str(e)}")
+    
+    def _submit_print_all(self, drawings_by_size, printers, quantity):
+        """Queue Print All's drawings once each paper size's printer is known"""
+        try:
+            state = {'printed': 0, 'failed': 0, 'size_summary': {}, 'quantity': quantity}
+            futures = []
+            
+            splitext = os.path.splitext
+            submit = self._print_pool.submit
+            print_file_direct = self.print_file_direct
+            
+            # Print each drawing using size-based printer selection. There is no
+            # os.path.exists pre-check: a missing file fails at submission and is
+            # counted as failed, which saves a stat per drawing on network shares.
+            for paper_size, drawing_paths in drawings_by_size.items():
+                printer_name = printers[paper_size]
+                if not printer_name:
+                    print(f"No printer configured for size {paper_size}: {len(drawing_paths)} drawings skipped")
+                    state['failed'] += len(drawing_paths)
+                    continue
+                
+                for drawing_path in drawing_paths:
                     try:
-                        # Detect paper size and get appropriate printer
-                        paper_size = self.detect_paper_size_from_drawing(drawing_path)
-                        printer_name = self.get_printer_for_size(paper_size)
-                        
-                        if printer_name:
-                            # Print directly to the configured printer
-                            success = self.print_file_direct(drawing_path, printer_name, quantity)
-                            if success:
-                                printed_count += 1
-                                
-                                # Track size summary
-                                if paper_size not in size_summary:
-                                    size_summary[paper_size] = {'count': 0, 'printer': printer_name}
-                                size_summary[paper_size]['count'] += 1
-                                
-                                print(f"Printed {quantity} copies of {os.path.basename(drawing_path)} (Size {paper_size}) to {printer_name}")
-                            else:
-                                failed_count += 1
-                                print(f"Failed to print {os.path.basename(drawing_path)}")
+                        if splitext(drawing_path)[1].lower() in ('.dwg', '.idw'):
+                            # These drive AutoCAD/Inventor and show dialogs, so print them here
+                            success = print_file_direct(drawing_path, printer_name, quantity)
+                            self._record_print_result(state, success, drawing_path, paper_size, printer_name)
                         else:
-                            print(f"No printer configured for size {paper_size}: {drawing_path}")
-                            failed_count += 1
+                            # Spooler submissions run on the print pool so the UI stays responsive
+                            future = submit(print_file_direct, drawing_path, printer_name, quantity)
+                            futures.append((future, drawing_path, paper_size, printer_name))
                     except Exception as e:
                         print(f"Failed to print {drawing_path}: {e}")
-                        failed_count += 1
-                else:
-                    print(f"File not found: {drawing_path}")
-                    failed_count += 1
-            
-            # Create detailed summary message
-            summary_parts = [f"Print job completed!\n\nSuccessfully printed: {printed_count}\nFailed: {failed_count}\nQuantity per drawing: {quantity}"]
+                        state['failed'] += 1
             
-            if size_summary:
-                summary_parts.append("\nSize Summary:")
-                for size, info in size_summary.items():
-                    summary_parts.append(f"Size {size}: {info['count']} drawings → {info['printer']}")
-            
-            messagebox.showinfo("Print Complete", "\n".join(summary_parts))
+            self.root.after(0, self._finish_print_all, futures, state)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to print drawings: {str(e)}")
     
+    def _record_print_result(self, state, success, drawing_path, paper_size, printer_name):
+        """Tally one print result for the Print All summary"""
+        if success:
+            state['printed'] += 1
+            
+            # Track size summary
+            size_summary = state['size_summary']
+            if paper_size not in size_summary:
+                size_summary[paper_size] = {'count': 0, 'printer': printer_name}
+            size_summary[paper_size]['count'] += 1
+            
+            print(f"Printed {state['quantity']} copies of {os.path.basename(drawing_path)} (Size {paper_size}) to {printer_name}")
+        else:
+            state['failed'] += 1
+            print(f"Failed to print {os.path.basename(drawing_path)}")
+    
+    def _finish_print_all(self, futures, state):
+        """Poll the print pool from the Tk loop and show the summary once every job is done"""
+        if not all(future.done() for future, *_ in futures):
+            self.root.after(100, self._finish_print_all, futures, state)
+            return
+        
+        for future, drawing_path, paper_size, printer_name in futures:
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"Failed to print {drawing_path}: {e}")
+                success = False
+            self._record_print_result(state, success, drawing_path, paper_size, printer_name)
+        
+        # Create detailed summary message
+        summary_parts = [f"Print job completed!\n\nSuccessfully printed: {state['printed']}\nFailed: {state['failed']}\nQuantity per drawing: {state['quantity']}"]
+        
+        size_summary = state['size_summary']
+        if size_summary:
+            summary_parts.append("\nSize Summary:")
+            for size, info in size_summary.items():
+                summary_parts.append(f"Size {size}: {info['count']} drawings → {info['printer']}")
+        
+        messagebox.showinfo("Print Complete", "\n".join(summary_parts))
+    
     def clear_current_drawings(self):
         """Clear all drawings for the current job"""
         if not self.current_project:
@@ -1633,17 +2230,14 @@ Y
         
         if messagebox.askyesno("Confirm Clear", f"Are you sure you want to delete all drawings for job {self.current_project}?"):
             try:
-                cursor = self.conn.cursor()
-                
-                cursor.execute("DELETE FROM drawings WHERE job_number = ?", (self.current_project,))
-                
-                self.conn.commit()
+                with self.conn:
+                    self.conn.execute("DELETE FROM drawings WHERE job_number = ?", (self.current_project,))
                 
-                # Refresh the current drawings list
-                self.load_current_drawings()
-                
-                # Refresh the project list to update drawing counts
-                self.load_projects()
+                # Empty the list in place; only this project's count needs reading back
+                self.current_drawings_tree.delete(*self._current_path_by_iid)
+                self._current_path_by_iid = {}
+                self._current_printed_iids = set()
+                self.refresh_project_counts([self.current_project])
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear drawings: {str(e)}")
@@ -1651,98 +2245,100 @@ Y
     def on_current_drawing_double_click(self, event):
         """Handle double-click on current drawings"""
         selection = self.current_drawings_tree.selection()
-        if selection:
-            item_id = selection[0]
-            drawing_path = self.current_drawings_tree.set(item_id, 'Path')
-            self.open_drawing(drawing_path)
+        if selection and selection[0] in self._current_path_by_iid:
+            self.open_drawing(self._current_path_by_iid[selection[0]])
     
     def on_current_drawing_right_click(self, event):
         """Handle right-click on current drawings"""
         selection = self.current_drawings_tree.selection()
-        if selection:
-            item_id = selection[0]
-            drawing_path = self.current_drawings_tree.set(item_id, 'Path')
-            
-            # Create context menu
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Open", command=lambda: self.open_drawing(drawing_path))
-            context_menu.add_command(label="Print", command=lambda: self.print_drawing(drawing_path))
-            context_menu.add_separator()
-            context_menu.add_command(label="Delete", command=lambda: self.delete_drawing(drawing_path))
+        if selection and selection[0] in self._current_path_by_iid:
+            self._ctx_drawing_path = self._current_path_by_iid[selection[0]]
             
             # Show context menu
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                self._current_context_menu.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                self._current_context_menu.grab_release()
     
     def on_global_drawing_double_click(self, event):
         """Handle double-click on global drawings"""
         selection = self.global_drawings_tree.selection()
-        if selection:
-            item_id = selection[0]
-            drawing_path = self.global_drawings_tree.set(item_id, 'Path')
-            self.open_drawing(drawing_path)
+        if selection and selection[0] in self._global_row_meta:
+            # Row meta starts with the drawing path
+            self.open_drawing(self._global_row_meta[selection[0]][0])
     
     def on_global_drawing_right_click(self, event):
         """Handle right-click on global drawings"""
         selection = self.global_drawings_tree.selection()
-        if selection:
-            item_id = selection[0]
-            drawing_path = self.global_drawings_tree.set(item_id, 'Path')
-            job_number = self.global_drawings_tree.set(item_id, 'Job Number')
-            
-            # Create context menu
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Open", command=lambda: self.open_drawing(drawing_path))
-            context_menu.add_command(label="Print", command=lambda: self.print_drawing(drawing_path))
-            context_menu.add_separator()
-            context_menu.add_command(label="Add to Current Job", command=lambda: self.add_drawing_from_global(drawing_path, job_number))
+        if selection and selection[0] in self._global_row_meta:
+            self._ctx_drawing_path = self._global_row_meta[selection[0]][0]
             
             # Show context menu
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                self._global_context_menu.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                self._global_context_menu.grab_release()
+    
+    def _ctx_open(self):
+        self.open_drawing(self._ctx_drawing_path)
+    
+    def _ctx_print(self):
+        self.print_drawing(self._ctx_drawing_path)
+    
+    def _ctx_delete(self):
+        self.delete_drawing(self._ctx_drawing_path)
+    
+    def _ctx_add_to_current(self):
+        # Every selected result, using the raw row data kept when the results were shown
+        row_meta = self._global_row_meta
+        drawings = [row_meta[item_id] for item_id in self.global_drawings_tree.selection() if item_id in row_meta]
+        self.add_drawing_from_global(drawings)
     
-    def add_drawing_from_global(self, drawing_path, source_job_number):
-        """Add a drawing from global search to current job"""
+    def add_drawings_bulk(self, rows):
+        """Insert drawing rows in one write transaction and return how many were added
+        
+        Each row is (job_number, drawing_path, drawing_name, drawing_type,
+        file_extension, added_by). Drawings that are already in the job are
+        skipped.
+        """
+        cursor = self.conn.cursor()
+        if not self.conn.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(self._SQL_INSERT_DRAWING, rows)
+            added_count = cursor.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return added_count
+    
+    def add_drawing_from_global(self, drawings):
+        """Add drawings from global search to current job
+        
+        ``drawings`` is a list of (drawing_path, drawing_name, drawing_type, file_extension)
+        taken from the search results, so no lookup against the source job is needed.
+        """
         if not self.current_project:
             messagebox.showwarning("Warning", "Please select a project first")
             return
         
+        if not drawings:
+            return
+        
         try:
-            cursor = self.conn.cursor()
-            
-            # Get drawing info from source job
-            cursor.execute("""
-                SELECT drawing_name, drawing_type, file_extension
-                FROM drawings 
-                WHERE job_number = ? AND drawing_path = ?
-            """, (source_job_number, drawing_path))
-            
-            drawing_info = cursor.fetchone()
-            if not drawing_info:
-                messagebox.showerror("Error", "Drawing not found in source job")
+            # Add to current job, skipping any already there
+            added_count = self.add_drawings_bulk([
+                (self.current_project, drawing_path, drawing_name, drawing_type, file_extension, "User")
+                for drawing_path, drawing_name, drawing_type, file_extension in drawings
+            ])
+            
+            if added_count == 0:
+                messagebox.showinfo("Info", "The selected drawings are already in the current job")
                 return
             
-            drawing_name, drawing_type, file_extension = drawing_info
-            
-            # Add to current job
-            cursor.execute("""
-                INSERT INTO drawings (job_number, drawing_path, drawing_name, drawing_type, 
-                                   file_extension, added_date, added_by)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (self.current_project, drawing_path, drawing_name, drawing_type, 
-                  file_extension, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "User"))
-            
-            self.conn.commit()
-            
-            # Refresh the current drawings list
-            self.load_current_drawings()
-            
-            # Refresh the project list to update drawing counts
-            self.load_projects()
+            # Refresh the drawings list and this project's count (coalesced into one pass)
+            self.request_refresh(self.current_project)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add drawing: {str(e)}")
@@ -1766,80 +2362,102 @@ Y
         try:
             cursor = self.conn.cursor()
             
-            # Get job directory from projects table
-            cursor.execute("""
-                SELECT job_directory FROM projects WHERE job_number = ?
-            """, (self.current_project,))
-            job_dir_result = cursor.fetchone()
-            
-            # Get drawings
+            # Get drawings, already encoded as a JSON array by SQLite
             cursor.execute("""
-                SELECT drawing_name, drawing_type, drawing_path, file_extension, added_date
-                FROM drawings 
-                WHERE job_number = ?
-                ORDER BY drawing_name
+                SELECT COUNT(*),
+                       json_group_array(json_object(
+                           'name', drawing_name,
+                           'type', drawing_type,
+                           'path', drawing_path,
+                           'extension', file_extension,
+                           'added_date', added_date))
+                FROM (SELECT drawing_name, drawing_type, drawing_path, file_extension, added_date
+                      FROM drawings 
+                      WHERE job_number = ?
+                      ORDER BY drawing_name)
             """, (self.current_project,))
             
-            drawings = cursor.fetchall()
+            total_drawings, drawings_json = cursor.fetchone()
             
-            if not drawings:
+            if not total_drawings:
                 messagebox.showinfo("Info", "No drawings found for this project")
                 return
             
-            # Create package data
-            package_data = {
+            # One timestamp for the export date and the file name
+            now = datetime.now()
+            file_stamp = now.strftime('%Y%m%d_%H%M%S')
+            
+            # Package header; the drawings array is spliced in as-is
+            header = {
                 'job_number': self.current_project,
-                'export_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'export_date': now.strftime("%Y-%m-%d %H:%M:%S"),
                 'exported_by': 'Print Package Manager',
-                'total_drawings': len(drawings),
-                'drawings': []
+                'total_drawings': total_drawings,
             }
             
-            for drawing in drawings:
-                drawing_name, drawing_type, drawing_path, file_extension, added_date = drawing
-                package_data['drawings'].append({
-                    'name': drawing_name,
-                    'type': drawing_type,
-                    'path': drawing_path,
-                    'extension': file_extension,
-                    'added_date': added_date
-                })
-            
             # Determine save location
-            if job_dir_result and job_dir_result[0]:
+            job_directory = self.get_export_directory(self.current_project)
+            if job_directory:
                 # Save to job directory
-                job_directory = job_dir_result[0]
-                if not os.path.exists(job_directory):
-                    os.makedirs(job_directory, exist_ok=True)
-                filename = os.path.join(job_directory, f"Print_Package_{self.current_project}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+                filename = os.path.join(job_directory, f"Print_Package_{self.current_project}_{file_stamp}.json")
             else:
                 # Save to current directory as fallback
-                filename = f"print_package_{self.current_project}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            # Save to file
-            with open(filename, 'w') as f:
-                json.dump(package_data, f, indent=2)
+                filename = f"print_package_{self.current_project}_{file_stamp}.json"
+            
+            # Save to file: compact JSON through a 1 MB buffer (the file is read back by Import Package)
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(json.dumps(header)[:-1])
+                f.write(', "drawings": ')
+                f.write(drawings_json)
+                f.write('}')
+            
+            # Binary sibling that imports faster; JSON stays the portable copy
+            if msgpack is not None:
+                package_data = dict(header, drawings=orjson.loads(drawings_json) if orjson is not None else json.loads(drawings_json))
+                pkg_filename = os.path.splitext(filename)[0] + '.pkg'
+                with open(pkg_filename, 'wb', buffering=1 << 20) as f:
+                    f.write(msgpack.packb(package_data, use_bin_type=True))
             
             messagebox.showinfo("Success", f"Print package exported to:\n{filename}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export package: {str(e)}")
     
+    def get_export_directory(self, job_number):
+        """Return the job's directory, created if missing, or None if it has none
+        
+        Cached per job so repeated exports skip the lookup and stat; the cache is
+        cleared whenever the project list is reloaded.
+        """
+        key = str(job_number)
+        if key in self._job_dir_cache:
+            return self._job_dir_cache[key]
+        
+        row = self.conn.execute(self._SQL_JOB_DIRECTORY, (job_number,)).fetchone()
+        job_directory = row[0] if row and row[0] else None
+        if job_directory and not os.path.exists(job_directory):
+            os.makedirs(job_directory, exist_ok=True)
+        self._job_dir_cache[key] = job_directory
+        return job_directory
+    
+    def get_job_directory(self, job_number):
+        """Return the job's directory if it exists, or None
+        
+        Read-only counterpart of get_export_directory: the folder is never created.
+        """
+        row = self.conn.execute(self._SQL_JOB_DIRECTORY, (job_number,)).fetchone()
+        if row and row[0] and os.path.exists(row[0]):
+            return row[0]
+        return None
+    
     def import_package(self):
         """Import a print package from JSON file"""
         # Get the initial directory for the file picker
         initial_dir = None
         if self.current_project:
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                    SELECT job_directory FROM projects WHERE job_number = ?
-                """, (self.current_project,))
-                job_dir_result = cursor.fetchone()
-                
-                if job_dir_result and job_dir_result[0] and os.path.exists(job_dir_result[0]):
-                    initial_dir = job_dir_result[0]
-                else:
+                initial_dir = self.get_job_directory(self.current_project)
+                if not initial_dir:
                     # Fallback to current working directory
                     initial_dir = os.getcwd()
             except Exception as e:
@@ -1855,6 +2473,7 @@ Y
             filetypes=[
                 ("JSON files", "*.json"),
                 ("Print Package files", "Print_Package_*.json"),
+                ("Binary Print Package files", "*.pkg"),
                 ("All files", "*.*")
             ]
         )
@@ -1863,92 +2482,183 @@ Y
             return
         
         try:
-            with open(filename, 'r') as f:
-                package_data = json.load(f)
+            if filename.lower().endswith('.pkg'):
+                if msgpack is None:
+                    messagebox.showerror("Error", "Reading .pkg packages requires the msgpack package.\nPlease import the .json file instead.")
+                    return
+                with open(filename, 'rb') as f:
+                    package_data = msgpack.unpackb(f.read(), raw=False)
+            elif orjson is not None:
+                with open(filename, 'rb') as f:
+                    package_data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    package_data = json.load(f)
             
-            # Validate package data
-            if 'job_number' not in package_data or 'drawings' not in package_data:
-                messagebox.showerror("Error", "Invalid print package file format")
+            # Validate package data before doing any work with it
+            error = _validate_package(package_data)
+            if error:
+                messagebox.showerror("Error", f"Invalid print package file format:\n{error}")
                 return
             
-            # Ask user what to do with the package
-            action = messagebox.askyesnocancel(
+            # Ask user what to do with the package; the choice arrives via callback
+            self._ask_choice(
                 "Import Print Package",
                 f"Print Package for Job: {package_data.get('job_number', 'Unknown')}\n"
                 f"Total Drawings: {len(package_data.get('drawings', []))}\n"
                 f"Export Date: {package_data.get('export_date', 'Unknown')}\n\n"
-                f"What would you like to do?\n\n"
-                f"Yes = Print All Drawings\n"
-                f"No = Add to Current Job\n"
-                f"Cancel = Just View Package"
+                f"What would you like to do?",
+                (('print', "Print All Drawings"), ('add', "Add to Current Job"), ('view', "Just View Package")),
+                lambda action: self._on_package_action(action, package_data),
             )
             
-            if action is True:  # Print all drawings
-                self.print_from_package_data(package_data)
-            elif action is False:  # Add to current job
-                self.add_package_to_current_job(package_data)
-            # Cancel = do nothing
-            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import package: {str(e)}")
     
+    def _on_package_action(self, action, package_data):
+        if action == 'print':  # Print all drawings
+            self.print_from_package_data(package_data)
+        elif action == 'add':  # Add to current job
+            self.add_package_to_current_job(package_data)
+        # View or closed = do nothing
+    
+    def _ask_choice(self, title, message, choices, on_choice):
+        """Show message with one button per (key, label) in choices, without waiting
+        
+        on_choice(key) is called once a button is pressed, or with None if the
+        window is closed. Unlike askyesnocancel, the buttons name the actions and
+        the caller returns straight away instead of sitting in a modal loop.
+        """
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry(self._centered_geometry(460, 240))
+        window.transient(self.root)
+        
+        frame = ttk.Frame(window, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=message, justify=tk.LEFT, wraplength=420).pack(anchor='w', pady=(0, 15))
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        def choose(key):
+            window.destroy()
+            on_choice(key)
+        
+        for key, label in choices:
+            ttk.Button(button_frame, text=label, command=lambda key=key: choose(key)).pack(side=tk.LEFT, padx=(0, 5))
+        window.protocol("WM_DELETE_WINDOW", lambda: choose(None))
+    
     def print_from_package_data(self, package_data):
         """Print all drawings from package data"""
-        drawings = package_data.get('drawings', [])
+        drawings = _package_drawing_rows(package_data)
         if not drawings:
             messagebox.showinfo("Info", "No drawings found in package")
             return
         
-        # Get printer selection once for all drawings
-        printed_count = 0
-        failed_count = 0
-        size_summary = {}
-        
-        for drawing in drawings:
-            drawing_path = drawing.get('path', '')
-            drawing_name = drawing.get('name', 'Unknown')
-            
-            if os.path.exists(drawing_path):
+        # Check which drawings exist on the print pool: on network shares reading
+        # the folders can take a while, and the window should stay responsive
+        future = self._print_pool.submit(
+            _existing_paths, [drawing_path for _name, _type, drawing_path, _ext in drawings])
+        self.root.after(0, self._poll_future, future,
+                        lambda existing: self._submit_package_prints(drawings, existing),
+                        "checking package drawings")
+    
+    def _submit_package_prints(self, drawings, existing):
+        """Resolve a printer for each paper size in the package, then queue its prints"""
+        # Once per paper size rather than per drawing: a size with no configured
+        # printer opens the picker, which should happen once per package
+        detect_paper_size = self.detect_paper_size_from_drawing
+        paper_sizes = dict.fromkeys(detect_paper_size(drawing_path)
+                                    for _name, _type, drawing_path, _ext in drawings if drawing_path in existing)
+        self._resolve_printers(paper_sizes, lambda printers: self._queue_package_prints(
+            drawings, existing, printers))
+    
+    def _queue_package_prints(self, drawings, existing, printers):
+        """Queue conversion and printing of the package's drawings that exist"""
+        state = {'printed': 0, 'failed': 0, 'size_summary': {}}
+        futures = []
+        converting = {}
+        
+        # Bound once; large packages run this loop thousands of times
+        detect_paper_size = self.detect_paper_size_from_drawing
+        pdf_export_path = self._pdf_export_path
+        submit = self._print_pool.submit
+        add_future = futures.append
+        job_number = self.current_project
+        
+        for drawing_name, _type, drawing_path, _extension in drawings:
+            drawing_name = drawing_name or 'Unknown'
+            
+            if drawing_path in existing:
                 try:
                     # Detect paper size and get appropriate printer
-                    paper_size = self.detect_paper_size_from_drawing(drawing_path)
-                    printer_name = self.get_printer_for_size(paper_size)
+                    paper_size = detect_paper_size(drawing_path)
+                    printer_name = printers[paper_size]
                     
                     if printer_name:
-                        # Convert to PDF and print
-                        pdf_path = self.convert_drawing_to_pdf(drawing_path, paper_size)
+                        # Work out the PDF's path here (uses the DB and may show dialogs),
+                        # then convert and print on the pool so drawings are processed
+                        # concurrently
+                        pdf_path = pdf_export_path(drawing_path)
                         
-                        if pdf_path and os.path.exists(pdf_path):
-                            success = self.print_pdf_file(pdf_path, printer_name)
-                            if success:
-                                printed_count += 1
-                                
-                                # Track size summary
-                                if paper_size not in size_summary:
-                                    size_summary[paper_size] = {'count': 0, 'printer': printer_name}
-                                size_summary[paper_size]['count'] += 1
-                                
-                                print(f"Printed {drawing_name} (Size {paper_size}) to {printer_name}")
-                            else:
-                                failed_count += 1
-                                print(f"Failed to print {drawing_name}")
+                        if pdf_path in converting:
+                            # Same target PDF as an earlier drawing: print it once that
+                            # conversion is done instead of writing the file twice at once
+                            future = submit(self._print_converted_pdf, converting[pdf_path],
+                                            pdf_path, printer_name)
+                            add_future((future, drawing_name, paper_size, printer_name))
+                        elif pdf_path:
+                            future = submit(self._convert_and_print_pdf, drawing_path, pdf_path,
+                                            paper_size, job_number, printer_name)
+                            converting[pdf_path] = future
+                            add_future((future, drawing_name, paper_size, printer_name))
                         else:
-                            failed_count += 1
+                            state['failed'] += 1
                             print(f"Failed to convert {drawing_name} to PDF")
                     else:
-                        failed_count += 1
+                        state['failed'] += 1
                         print(f"No printer configured for size {paper_size}: {drawing_name}")
                 except Exception as e:
                     print(f"Failed to print {drawing_name}: {e}")
-                    failed_count += 1
+                    state['failed'] += 1
             else:
                 print(f"File not found: {drawing_path}")
-                failed_count += 1
+                state['failed'] += 1
+        
+        self.root.after(0, self._finish_package_print, futures, state)
+    
+    def _finish_package_print(self, futures, state):
+        """Wait for the package's print jobs from the Tk loop, then show the summary"""
+        if not all(future.done() for future, *_ in futures):
+            self.root.after(100, self._finish_package_print, futures, state)
+            return
+        
+        size_summary = state['size_summary']
+        for future, drawing_name, paper_size, printer_name in futures:
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"Failed to print {drawing_name}: {e}")
+                success = False
+            
+            if success:
+                state['printed'] += 1
+                
+                # Track size summary
+                if paper_size not in size_summary:
+                    size_summary[paper_size] = {'count': 0, 'printer': printer_name}
+                size_summary[paper_size]['count'] += 1
+                
+                print(f"Printed {drawing_name} (Size {paper_size}) to {printer_name}")
+            else:
+                state['failed'] += 1
+                print(f"Failed to print {drawing_name}")
         
         # Show summary
         summary_text = f"Package print completed!\n\n"
-        summary_text += f"Successfully printed: {printed_count}\n"
-        summary_text += f"Failed: {failed_count}\n\n"
+        summary_text += f"Successfully printed: {state['printed']}\n"
+        summary_text += f"Failed: {state['failed']}\n\n"
         
         if size_summary:
             summary_text += "Size breakdown:\n"
@@ -1963,63 +2673,45 @@ Y
             messagebox.showwarning("Warning", "Please select a project first")
             return
         
-        drawings = package_data.get('drawings', [])
+        drawings = _package_drawing_rows(package_data)
         if not drawings:
             messagebox.showinfo("Info", "No drawings found in package")
             return
         
         try:
-            cursor = self.conn.cursor()
-            added_count = 0
-            
-            for drawing in drawings:
-                drawing_name = drawing.get('name', '')
-                drawing_type = drawing.get('type', '')
-                drawing_path = drawing.get('path', '')
-                file_extension = drawing.get('extension', '')
-                
-                # Check if drawing already exists in current job
-                cursor.execute("""
-                    SELECT COUNT(*) FROM drawings 
-                    WHERE job_number = ? AND drawing_path = ?
-                """, (self.current_project, drawing_path))
-                
-                if cursor.fetchone()[0] == 0:  # Not already in current job
-                    cursor.execute("""
-                        INSERT INTO drawings (job_number, drawing_path, drawing_name, drawing_type, 
-                                           file_extension, added_date, added_by)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (self.current_project, drawing_path, drawing_name, drawing_type, 
-                          file_extension, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "Import"))
-                    added_count += 1
+            rows = [
+                (self.current_project, drawing_path, drawing_name, drawing_type, file_extension, "Import")
+                for drawing_name, drawing_type, drawing_path, file_extension in drawings
+            ]
             
-            self.conn.commit()
+            added_count = self.add_drawings_bulk(rows)
             
-            # Refresh the current drawings list
-            self.load_current_drawings()
-            
-            # Refresh the project list to update drawing counts
-            self.load_projects()
+            # Refresh the drawings list and this project's count (coalesced into one pass)
+            self.request_refresh(self.current_project)
             
             messagebox.showinfo("Import Complete", f"Added {added_count} drawings to current job")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add package to current job: {str(e)}")
     
+    def _centered_geometry(self, width, height):
+        """Geometry string placing a width x height window at the center of the screen
+        
+        Dialogs have fixed sizes, so they can be placed before they are shown,
+        without an update_idletasks() pass or asking the display for its size.
+        """
+        x = (self._screen_w - width) // 2
+        y = (self._screen_h - height) // 2
+        return f"{width}x{height}+{x}+{y}"
+    
     def setup_printers(self):
         """Setup printer configuration for different paper sizes"""
         setup_window = tk.Toplevel(self.root)
         setup_window.title("Printer Setup - Paper Size Configuration")
-        setup_window.geometry("700x600")
+        setup_window.geometry(self._centered_geometry(700, 600))
         setup_window.transient(self.root)
         setup_window.grab_set()
         
-        # Center the window
-        setup_window.update_idletasks()
-        x = (setup_window.winfo_screenwidth() // 2) - (700 // 2)
-        y = (setup_window.winfo_screenheight() // 2) - (600 // 2)
-        setup_window.geometry(f"700x600+{x}+{y}")
-        
         # Main frame
         main_frame = ttk.Frame(setup_window, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -2048,6 +2740,7 @@ Y
         printer_vars = {}
         orientation_vars = {}
         paper_type_vars = {}
+        printer_combos = []
         
         for i, size in enumerate(paper_sizes):
             size_frame = ttk.Frame(config_frame)
@@ -2064,6 +2757,7 @@ Y
             printer_combo = ttk.Combobox(size_frame, textvariable=printer_var, 
                                        values=available_printers, state="readonly", width=30)
             printer_combo.pack(side=tk.LEFT, padx=(0, 10))
+            printer_combos.append(printer_combo)
             
             # Orientation selection
             orientation_var = tk.StringVar()
@@ -2091,31 +2785,33 @@ Y
         
         def save_configuration():
             try:
-                cursor = self.conn.cursor()
-                saved_count = 0
-                
-                for size in paper_sizes:
-                    printer_name = printer_vars[size].get()
-                    orientation = orientation_vars[size].get()
-                    paper_type = paper_type_vars[size].get()
+                # One transaction, rolled back if any size fails to save
+                with self.conn:
+                    cursor = self.conn.cursor()
+                    saved_count = 0
                     
-                    print(f"Saving {size}: Printer={printer_name}, Orientation={orientation}, PaperType={paper_type}")
-                    
-                    if printer_name and printer_name.strip():
-                        # Insert or update printer configuration
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO printer_config 
-                            (paper_size, printer_name, paper_type, orientation, created_date, updated_date)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                        ''', (size, printer_name.strip(), paper_type or 'Standard', orientation or 'Portrait', 
-                              datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                              datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-                        saved_count += 1
-                        print(f"Saved configuration for size {size}")
-                    else:
-                        print(f"No printer selected for size {size}")
+                    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    for size in paper_sizes:
+                        printer_name = printer_vars[size].get()
+                        orientation = orientation_vars[size].get()
+                        paper_type = paper_type_vars[size].get()
+                        
+                        print(f"Saving {size}: Printer={printer_name}, Orientation={orientation}, PaperType={paper_type}")
+                        
+                        if printer_name and printer_name.strip():
+                            # Insert or update printer configuration
+                            cursor.execute('''
+                                INSERT OR REPLACE INTO printer_config 
+                                (paper_size, printer_name, paper_type, orientation, created_date, updated_date)
+                                VALUES (?, ?, ?, ?, ?, ?)
+                            ''', (size, printer_name.strip(), paper_type or 'Standard', orientation or 'Portrait', 
+                                  now_str, now_str))
+                            saved_count += 1
+                            print(f"Saved configuration for size {size}")
+                        else:
+                            print(f"No printer selected for size {size}")
                 
-                self.conn.commit()
+                self._printer_for_size.clear()
                 
                 if saved_count > 0:
                     messagebox.showinfo("Success", f"Printer configuration saved successfully!\n\nSaved {saved_count} printer configurations.")
@@ -2217,6 +2913,12 @@ Y
             else:
                 messagebox.showwarning("No Printers", "No printers found. Please install at least one printer to use this feature.")
         
+        def refresh_printers():
+            """Enumerate the printers again, e.g. after one was just installed"""
+            printers = self.get_available_printers(refresh=True)
+            for combo in printer_combos:
+                combo['values'] = printers
+        
         # Add buttons to the frame
         load_btn = ttk.Button(button_frame, text="Load Test Data", command=load_test_data)
         load_btn.pack(side=tk.LEFT, padx=(0, 10))
@@ -2230,6 +2932,9 @@ Y
         test_btn = ttk.Button(button_frame, text="Test Print", command=test_actual_print)
         test_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        refresh_btn = ttk.Button(button_frame, text="Refresh Printers", command=refresh_printers)
+        refresh_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         cancel_btn = ttk.Button(button_frame, text="Cancel", command=setup_window.destroy)
         cancel_btn.pack(side=tk.RIGHT)
     
@@ -2237,69 +2942,23 @@ Y
         """Create a test PDF file for testing printer configuration"""
         print(f"Creating test PDF: {filename} for size {size}")
         try:
-            from reportlab.lib.pagesizes import letter, legal, A4
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.units import inch
-            
-            print("ReportLab imported successfully")
-            
             # Define paper sizes (in inches, landscape orientation)
-            size_dimensions = {
-                'A': (11, 8.5),    # 8.5T x 11W (landscape)
-                'B': (17, 11),     # 11T x 17W (landscape) 
-                'C': (24, 18),     # 18T x 24W (landscape)
-                'D': (36, 24)      # 24T x 36W (landscape)
-            }
-            
-            width, height = size_dimensions.get(size, (11, 8.5))
+            width, height = PAPER_SIZES.get(size, DEFAULT_PAPER_SIZE)
             print(f"Paper dimensions: {width}\" x {height}\"")
             
             # Create PDF
-            c = canvas.Canvas(filename, pagesize=(width * inch, height * inch))
-            print(f"Canvas created for {filename}")
-            
-            # Add content
-            c.setFont("Helvetica-Bold", 24)
-            c.drawString(1 * inch, height * inch - 1.5 * inch, f"TEST PRINT - SIZE {size}")
-            
-            c.setFont("Helvetica", 16)
-            c.drawString(1 * inch, height * inch - 2.5 * inch, f"Printer: {printer_name}")
-            c.drawString(1 * inch, height * inch - 3 * inch, f"Orientation: {orientation}")
-            c.drawString(1 * inch, height * inch - 3.5 * inch, f"Paper Type: {paper_type}")
-            c.drawString(1 * inch, height * inch - 4 * inch, f"Dimensions: {width}\" x {height}\"")
-            c.drawString(1 * inch, height * inch - 4.5 * inch, f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # Add border
-            c.rect(0.5 * inch, 0.5 * inch, (width - 1) * inch, (height - 1) * inch)
-            
-            # Add corner marks
-            corner_size = 0.5 * inch
-            c.rect(0.5 * inch, 0.5 * inch, corner_size, corner_size)
-            c.rect((width - 1) * inch, 0.5 * inch, corner_size, corner_size)
-            c.rect(0.5 * inch, (height - 1) * inch, corner_size, corner_size)
-            c.rect((width - 1) * inch, (height - 1) * inch, corner_size, corner_size)
-            
-            c.save()
+            layout = PAGE_LAYOUTS.get(size, PAGE_LAYOUTS['A'])
+            with open(filename, 'wb') as f:
+                f.write(_info_page_pdf(layout, f"TEST PRINT - SIZE {size}", (
+                    f"Printer: {printer_name}",
+                    f"Orientation: {orientation}",
+                    f"Paper Type: {paper_type}",
+                    f"Dimensions: {width}\" x {height}\"",
+                    f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                )))
             print(f"PDF saved successfully: {filename}")
             return True
             
-        except ImportError as e:
-            print(f"ReportLab not available: {e}")
-            # Fallback if reportlab not available
-            try:
-                # Create a simple text file as fallback
-                txt_filename = filename.replace('.pdf', '.txt')
-                with open(txt_filename, 'w') as f:
-                    f.write(f"TEST PRINT - SIZE {size}\n")
-                    f.write(f"Printer: {printer_name}\n")
-                    f.write(f"Orientation: {orientation}\n")
-                    f.write(f"Paper Type: {paper_type}\n")
-                    f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                print(f"Created text file fallback: {txt_filename}")
-                return True
-            except Exception as e2:
-                print(f"Could not create text file fallback: {e2}")
-                return False
         except Exception as e:
             print(f"Error creating test PDF: {e}")
             return False
@@ -2308,7 +2967,13 @@ Y
         """Print a PDF file to the specified printer"""
         print(f"Attempting to print {pdf_file} to {printer_name}")
         try:
-            # Use Windows print command for PDF
+            # Spool the file straight to the printer, as PRINT does, without a cmd.exe
+            spooled = _print_raw(pdf_file, printer_name)
+            if spooled is not None:
+                print(f"Spooled {os.path.basename(pdf_file)} to {printer_name}")
+                return spooled
+            
+            # Without pywin32, use the Windows print command for PDF
             cmd = ['cmd', '/c', 'print', f'/d:{printer_name}', pdf_file]
             print(f"Running command: {' '.join(cmd)}")
             
@@ -2322,13 +2987,10 @@ Y
             print(f"Error printing PDF: {e}")
             return False
     
-    def get_available_printers(self):
-        """Get list of available printers"""
+    def get_available_printers(self, refresh=False):
+        """Get list of available printers (cached briefly; refresh enumerates again)"""
         try:
-            import win32print
-            printers = []
-            for printer in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS):
-                printers.append(printer[2])  # printer[2] is the printer name
+            printers = _enum_printers(refresh)
             return printers
         except ImportError:
             return ["Microsoft Print to PDF", "Default Printer"]
@@ -2377,43 +3039,66 @@ Y
             paper_type_var.set('Standard')
     
     def get_printer_for_size(self, paper_size):
-        """Get the configured printer for a specific paper size"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT printer_name FROM printer_config WHERE paper_size = ?
-            """, (paper_size,))
-            result = cursor.fetchone()
-            if result:
-                return result[0]
-            else:
-                # Fallback to default printer selection
-                return self.get_printer_name()
-        except Exception as e:
-            print(f"Error getting printer for size {paper_size}: {e}")
-            return self.get_printer_name()
+        """Get the configured printer for a specific paper size, or None"""
+        if paper_size not in self._printer_for_size:
+            try:
+                # One query caches every configured size, so a Print All covering
+                # several sizes reads printer_config once
+                self._printer_for_size.update(
+                    self.conn.execute("SELECT paper_size, printer_name FROM printer_config"))
+            except Exception as e:
+                print(f"Error getting printer for size {paper_size}: {e}")
+        return self._printer_for_size.get(paper_size)
+    
+    def _resolve_printers(self, paper_sizes, on_done):
+        """Find a printer for each paper size, then call on_done({paper_size: printer})
+        
+        Sizes with a configured printer are looked up directly. For the others the
+        user is asked (not cached), one size after another and without blocking the
+        event loop; a cancelled picker leaves that size's printer None.
+        """
+        printers = {}
+        unconfigured = []
+        for paper_size in paper_sizes:
+            printers[paper_size] = self.get_printer_for_size(paper_size)
+            if not printers[paper_size]:
+                unconfigured.append(paper_size)
+        
+        def ask_next():
+            if not unconfigured:
+                on_done(printers)
+                return
+            paper_size = unconfigured.pop(0)
+            
+            def chosen(printer_name):
+                printers[paper_size] = printer_name
+                ask_next()
+            
+            self.get_printer_name(chosen)
+        
+        ask_next()
     
     def detect_paper_size_from_drawing(self, drawing_path):
         """Detect paper size from drawing file"""
+        # Detection only looks at the filename, so the result never changes for a path
+        size = self._paper_size_cache.get(drawing_path)
+        if size:
+            return size
+        
         drawing_name = os.path.basename(drawing_path).upper()
         
         # Look for size indicators in filename (case insensitive)
-        size_patterns = {
-            'A': ['A-SIZE', 'A_SIZE', '_A.', 'SIZE-A', 'SIZE_A', '8.5X11', '8.5X11', 'A4', 'LETTER'],
-            'B': ['B-SIZE', 'B_SIZE', '_B.', 'SIZE-B', 'SIZE_B', '11X17', '11X17', 'B4', 'TABLOID'],
-            'C': ['C-SIZE', 'C_SIZE', '_C.', 'SIZE-C', 'SIZE_C', '18X24', '18X24', 'C4', '18X24'],
-            'D': ['D-SIZE', 'D_SIZE', '_D.', 'SIZE-D', 'SIZE_D', '24X36', '24X36', 'D4', '24X36']
-        }
-        
-        for size, patterns in size_patterns.items():
+        for size, patterns in PAPER_SIZE_PATTERNS:
             for pattern in patterns:
                 if pattern in drawing_name:
                     print(f"Detected size {size} from pattern '{pattern}' in filename: {drawing_name}")
+                    self._paper_size_cache[drawing_path] = size
                     return size
         
         # If no pattern found, try to detect from file size or other methods
         # For now, default to A size
         print(f"No size pattern found in filename: {drawing_name}, defaulting to A")
+        self._paper_size_cache[drawing_path] = 'A'
         return 'A'
     
     def toggle_fullscreen(self):
@@ -219,6 +219,8 @@ class ProjectsApp:
         
         # Configure tags for row highlighting
         self.tree.tag_configure('selected', background='#E8F0FE', font=('Arial', 9, 'bold'))
+        self.tree.tag_configure('overdue', background='#ffecec')
+        self.tree.tag_configure('soon', background='#fff8e1')
         
         # Set column widths
         self.tree.heading('Job Number', text='Job Number')
@@ -3711,6 +3713,7 @@ class ProjectsApp:
             
             # Calculate days until due
             days_until_due = ""
+            tags = ()
             if due_date and not completion_date:
                 try:
                     due = datetime.strptime(due_date, "%Y-%m-%d")
@@ -3723,16 +3726,18 @@ class ProjectsApp:
                         days_until_due = "Today"
                     else:
                         days_until_due = str(days_diff)
+                    tags = self._due_tags(days_diff)
                 except:
                     days_until_due = ""
             
+            # Tags are passed on insert so highlighting costs no extra Tcl calls
             self.tree.insert('', 'end', values=(
                 job_number,
                 customer_name,
                 due_date,
                 days_until_due,
                 status
-            ))
+            ), tags=tags)
 
         # Apply current visibility (hide completed if needed)
         try:
@@ -3742,6 +3747,15 @@ class ProjectsApp:
         
         conn.close()
     
+    @staticmethod
+    def _due_tags(days_diff):
+        """Return the Treeview tags used to highlight a job due in days_diff days"""
+        if days_diff < 0:
+            return ('overdue',)
+        if days_diff <= 3:
+            return ('soon',)
+        return ()
+
     def filter_projects(self, *args):
         """Filter projects based on search term"""
         search_term = self.search_var.get().lower()
@@ -3775,8 +3789,8 @@ class ProjectsApp:
         # Get all current items and their values
         items = []
         for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            items.append(values)
+            info = self.tree.item(item)
+            items.append((info['values'], info['tags']))
         
         # Clear the tree
         for item in self.tree.get_children():
@@ -3784,8 +3798,8 @@ class ProjectsApp:
         
         # Sort by job number (convert to int for proper numeric sorting)
         # Handle both numeric and non-numeric job numbers
-        def job_sort_key(x):
-            job_num = str(x[0]).strip()
+        def job_sort_key(entry):
+            job_num = str(entry[0][0]).strip()
             if job_num.isdigit():
                 return int(job_num)
             else:
@@ -3808,23 +3822,23 @@ class ProjectsApp:
         self.sort_job_btn.config(text=f"Job # {direction}")
         
         # Add sorted items back
-        for item in sorted_items:
-            self.tree.insert('', 'end', values=item)
+        for values, tags in sorted_items:
+            self.tree.insert('', 'end', values=values, tags=tags)
     
     def sort_by_customer(self):
         """Sort projects by customer name (toggle ascending/descending)"""
         # Get all current items and their values
         items = []
         for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            items.append(values)
+            info = self.tree.item(item)
+            items.append((info['values'], info['tags']))
         
         # Clear the tree
         for item in self.tree.get_children():
             self.tree.delete(item)
         
         # Sort by customer name (case-insensitive)
-        sorted_items = sorted(items, key=lambda x: x[1].upper() if x[1] else "", reverse=not self.customer_sort_ascending)
+        sorted_items = sorted(items, key=lambda x: x[0][1].upper() if x[0][1] else "", reverse=not self.customer_sort_ascending)
         
         # Toggle direction for next time
         self.customer_sort_ascending = not self.customer_sort_ascending
@@ -3834,8 +3848,8 @@ class ProjectsApp:
         self.sort_customer_btn.config(text=f"Customer {direction}")
         
         # Add sorted items back
-        for item in sorted_items:
-            self.tree.insert('', 'end', values=item)
+        for values, tags in sorted_items:
+            self.tree.insert('', 'end', values=values, tags=tags)
     
     def sort_by_due_date(self):
         """Sort projects by due date - earliest on top when ascending"""
@@ -3873,6 +3887,7 @@ class ProjectsApp:
             
             # Calculate days until due
             days_until_due = ""
+            tags = ()
             if due_date and not completion_date:
                 try:
                     due = datetime.strptime(due_date, "%Y-%m-%d")
@@ -3885,11 +3900,12 @@ class ProjectsApp:
                         days_until_due = "Today"
                     else:
                         days_until_due = str(days_diff)
+                    tags = self._due_tags(days_diff)
                 except:
                     days_until_due = ""
             
             self.tree.insert('', 'end', values=(job_num, customer or '', due_date or '', 
-                                               days_until_due, status))
+                                               days_until_due, status), tags=tags)
         
         # Toggle direction for next time
         self.due_date_sort_ascending = not self.due_date_sort_ascending
@@ -3905,12 +3921,13 @@ class ProjectsApp:
             print("DEBUG: No selection")
             return
         
-        # Remove 'selected' tag from all items
-        for item in self.tree.get_children():
-            self.tree.item(item, tags=())
+        # Remove 'selected' tag only from the rows that carry it, keeping due-date tags
+        for item in self.tree.tag_has('selected'):
+            self.tree.item(item, tags=[t for t in self.tree.item(item, 'tags') if t != 'selected'])
         
         # Add 'selected' tag to selected item
-        self.tree.item(selection[0], tags=('selected',))
+        tags = [t for t in self.tree.item(selection[0], 'tags') if t != 'selected']
+        self.tree.item(selection[0], tags=tags + ['selected'])
         
         item = self.tree.item(selection[0])
         job_number = item['values'][0]
@@ -4678,7 +4695,13 @@ class ProjectsApp:
         if not values:
             return
         job_number = values[0]
-        open_add_note_dialog(self.root, str(job_number))
+        open_add_note_dialog(self.root, str(job_number), on_saved=self._after_note_saved)
+
+    def _after_note_saved(self, job_number, fragment):
+        """Show a newly added note without reloading the whole notes blob"""
+        # Other jobs read their notes fresh from the DB when selected
+        if str(self.current_job_notes) == str(job_number):
+            self.notes_text.insert('1.0', fragment)
 
     def preload_job(self, job_number):
         """Preload a specific job number in the table"""